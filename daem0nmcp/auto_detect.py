@@ -11,6 +11,7 @@ Used by daem0n_remember for auto-detection validation and by
 memory.py recall() for per-category decay scoring.
 """
 
+import math
 import re
 from typing import Dict, Optional, TYPE_CHECKING
 
@@ -36,6 +37,26 @@ NOISE_PATTERNS = [
     re.compile(r'^(yes|no|yeah|yep|nope|nah|okay|ok|sure|right|got it|I see)\b', re.IGNORECASE),
 ]
 
+# All noise patterns fused into one alternation so validation is a single
+# match() call instead of one per pattern.
+NOISE_RE = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern in NOISE_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Lowercase two-character prefixes of every NOISE_PATTERNS alternative.
+# Content whose (ASCII) first two characters are not listed here cannot be
+# noise, so the regex call is skipped. Coverage of every NOISE_PATTERNS
+# alternative is enforced by test_prefixes_cover_every_alternative.
+_NOISE_PREFIXES = frozenset({
+    "hi", "he", "go", "by", "se", "ta",        # greetings and farewells
+    "th", "yo", "no", "su",                    # thanks and acknowledgments
+    "i'",                                      # status responses
+    "um", "uh", "hm", "we", "so", "an", "ac", "ba",  # filler words
+    "ca", "co", "wo", "le", "sh", "do",        # Claude's own questions
+    "ye", "na", "ok", "ri", "i ",              # bare acknowledgments
+})
+
 # =============================================================================
 # Quality thresholds for content validation
 # =============================================================================
@@ -62,6 +83,16 @@ CATEGORY_HALF_LIVES: Dict[str, float] = {
     'context': 14.0,    # Fastest decay - situational info
 }
 
+# Exponential decay constants (ln 2 / half-life) precomputed per category so
+# recall scoring only needs exp(-k * age). Auto-detected memories use the
+# shortened half-life, i.e. a proportionally larger constant.
+CATEGORY_DECAY_K: Dict[str, float] = {
+    cat: math.log(2) / half_life for cat, half_life in CATEGORY_HALF_LIVES.items()
+}
+CATEGORY_DECAY_K_AUTO: Dict[str, float] = {
+    cat: k / AUTO_DECAY_MULTIPLIER for cat, k in CATEGORY_DECAY_K.items()
+}
+
 # =============================================================================
 # Confidence routing - default thresholds
 # =============================================================================
@@ -78,11 +109,12 @@ def validate_auto_memory(
     """
     Validate content for auto-detection storage.
 
-    Checks:
-    1. Noise patterns (greetings, filler, acknowledgments)
-    2. Minimum content length (15 chars)
-    3. Minimum word count (4 words)
-    4. Confidence-based routing
+    Checks (cheapest first):
+    1. Confidence below the medium threshold
+    2. Noise patterns (greetings, filler, acknowledgments)
+    3. Minimum content length (15 chars)
+    4. Minimum word count (4 words)
+    5. Confidence-based routing
 
     Args:
         content: The memory content to validate
@@ -96,35 +128,37 @@ def validate_auto_memory(
         - reason: str - "noise_filter", "too_short", "too_few_words",
                         or "low_confidence" (only if valid=False)
     """
-    # Strip and lowercase for noise check (preserve original for other checks)
+    # 1. Get thresholds from settings or use defaults, and reject low
+    # confidence before inspecting the content at all
+    # (Settings declares both fields with defaults, so plain attribute access suffices)
+    if settings is not None:
+        high_threshold = settings.auto_detect_confidence_high
+        medium_threshold = settings.auto_detect_confidence_medium
+    else:
+        high_threshold = DEFAULT_CONFIDENCE_HIGH
+        medium_threshold = DEFAULT_CONFIDENCE_MEDIUM
+
+    if confidence < medium_threshold:
+        return {"valid": False, "reason": "low_confidence"}
+
     stripped = content.strip()
-    lowered = stripped.lower()
 
-    # 1. Check noise patterns
-    for pattern in NOISE_PATTERNS:
-        if pattern.match(lowered):
-            return {"valid": False, "reason": "noise_filter"}
+    # 2. Check noise patterns (case-insensitive, no lowered copy needed).
+    # Non-ASCII prefixes always go to the regex since IGNORECASE folds some
+    # non-ASCII characters onto ASCII letters.
+    prefix = stripped[:2].lower()
+    if (not prefix.isascii() or prefix in _NOISE_PREFIXES) and NOISE_RE.match(stripped):
+        return {"valid": False, "reason": "noise_filter"}
 
-    # 2. Check minimum length
+    # 3. Check minimum length
     if len(stripped) < MIN_CONTENT_LENGTH:
         return {"valid": False, "reason": "too_short"}
 
-    # 3. Check minimum word count
-    if len(stripped.split()) < MIN_WORD_COUNT:
+    # 4. Check minimum word count (bounded split: only the first few words matter)
+    if len(stripped.split(maxsplit=MIN_WORD_COUNT - 1)) < MIN_WORD_COUNT:
         return {"valid": False, "reason": "too_few_words"}
 
-    # 4. Get thresholds from settings or use defaults
-    if settings is not None:
-        high_threshold = getattr(settings, 'auto_detect_confidence_high', DEFAULT_CONFIDENCE_HIGH)
-        medium_threshold = getattr(settings, 'auto_detect_confidence_medium', DEFAULT_CONFIDENCE_MEDIUM)
-    else:
-        high_threshold = DEFAULT_CONFIDENCE_HIGH
-        medium_threshold = DEFAULT_CONFIDENCE_MEDIUM
-
     # 5. Confidence routing
     if confidence >= high_threshold:
         return {"valid": True, "action": "auto_store"}
-    elif confidence >= medium_threshold:
-        return {"valid": True, "action": "suggest"}
-    else:
-        return {"valid": False, "reason": "low_confidence"}
+    return {"valid": True, "action": "suggest"}
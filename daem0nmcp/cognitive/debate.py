@@ -130,7 +130,7 @@ async def _gather_evidence(
     Returns:
         A fully populated :class:`DebateArgument`.
     """
-    user_name = getattr(ctx, "current_user", "default") or "default"
+    user_name = ctx.current_user or "default"
     recall_result = await ctx.memory_manager.recall(
         topic=f"{topic} {position}",
         user_id=ctx.user_id,
@@ -423,7 +423,7 @@ async def _run_debate_inner(
     # Persist consensus memory (TOOL-04)
     # ------------------------------------------------------------------
     consensus_memory_id: Optional[int] = None
-    user_name = getattr(ctx, "current_user", "default") or "default"
+    user_name = ctx.current_user or "default"
     try:
         remember_result = await ctx.memory_manager.remember(
             categories=["fact"],  # Debate consensus is factual knowledge
@@ -187,7 +187,7 @@ async def _outcome_correlation_analysis(
     unknown = 0
 
     try:
-        user_name = getattr(ctx, "current_user", "default") or "default"
+        user_name = ctx.current_user or "default"
         recall_result = await ctx.memory_manager.recall(
             topic=trigger,
             user_id=ctx.user_id,
@@ -171,7 +171,7 @@ async def _run_simulation_inner(
     # ------------------------------------------------------------------
     # 1. Look up the decision memory
     # ------------------------------------------------------------------
-    user_name_for_lookup = getattr(ctx, "current_user", "default") or "default"
+    user_name_for_lookup = ctx.current_user or "default"
     async with ctx.db_manager.get_session() as session:
         result = await session.execute(
             select(Memory).where(
@@ -217,7 +217,7 @@ async def _run_simulation_inner(
     # ------------------------------------------------------------------
     # 3. Reconstruct historical context (what was known THEN)
     # ------------------------------------------------------------------
-    user_name = getattr(ctx, "current_user", "default") or "default"
+    user_name = ctx.current_user or "default"
     historical_recall = await mm.recall(
         topic=query_topic,
         as_of_time=decision_time_dt,
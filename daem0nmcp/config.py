@@ -32,6 +32,9 @@ class Settings(BaseSettings):
     # Server
     log_level: str = "INFO"
 
+    # Database
+    sqlite_pool_size: int = Field(default=5, ge=1)  # Pooled connections per user database
+
     # Context management
     max_project_contexts: int = 10  # Maximum cached user contexts
     context_ttl_seconds: int = 3600  # 1 hour TTL for unused contexts
@@ -20,6 +20,7 @@ import asyncio
 import contextlib
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
@@ -68,8 +69,9 @@ class UserContext:
     known_users: List[str] = field(default_factory=list)  # All users on this device
 
 
-# Cache of user contexts by normalized path
-_user_contexts: Dict[str, UserContext] = {}
+# Cache of user contexts by normalized path, kept in access order (most
+# recently used last) so the dream scheduler can pick the latest in O(1)
+_user_contexts: "OrderedDict[str, UserContext]" = OrderedDict()
 _context_locks: Dict[str, asyncio.Lock] = {}
 _contexts_lock = RWLock()  # RWLock for context access: multiple readers, exclusive writers
 _task_contexts: Dict[asyncio.Task, Dict[str, int]] = {}
@@ -309,6 +311,13 @@ async def _release_current_task_contexts() -> None:
         await _release_task_contexts(task)
 
 
+def _touch_context(normalized: str, ctx: UserContext, now: float) -> None:
+    """Record an access: update the timestamp and move to the recent end."""
+    ctx.last_accessed = now
+    if normalized in _user_contexts:
+        _user_contexts.move_to_end(normalized)
+
+
 def _maybe_schedule_eviction(now: float) -> None:
     """Avoid running eviction too frequently."""
     global _last_eviction
@@ -357,7 +366,7 @@ async def get_user_context(user_id: Optional[str] = None) -> UserContext:
             ctx = _user_contexts[normalized]
             if ctx.initialized:
                 now = time.time()
-                ctx.last_accessed = now
+                _touch_context(normalized, ctx, now)
                 # Opportunistic eviction: trigger background cleanup if over limit
                 if len(_user_contexts) > MAX_USER_CONTEXTS:
                     asyncio.create_task(evict_stale_contexts())
@@ -373,7 +382,7 @@ async def get_user_context(user_id: Optional[str] = None) -> UserContext:
             ctx = _user_contexts[normalized]
             if ctx.initialized:
                 now = time.time()
-                ctx.last_accessed = now
+                _touch_context(normalized, ctx, now)
                 _maybe_schedule_eviction(now)
                 await _track_task_context(ctx)
                 return ctx
@@ -390,7 +399,7 @@ async def get_user_context(user_id: Optional[str] = None) -> UserContext:
             ctx = _user_contexts[normalized]
             if ctx.initialized:
                 now = time.time()
-                ctx.last_accessed = now
+                _touch_context(normalized, ctx, now)
                 _maybe_schedule_eviction(now)
                 await _track_task_context(ctx)
                 return ctx
@@ -520,7 +529,7 @@ async def evict_stale_contexts() -> int:
 
 async def cleanup_all_contexts():
     """Clean up all user contexts on shutdown."""
-    for path, ctx in _user_contexts.items():
+    for path, ctx in list(_user_contexts.items()):
         try:
             await ctx.db_manager.close()
             logger.info(f"Closed database for: {path}")
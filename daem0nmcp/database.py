@@ -3,7 +3,6 @@ Database Manager - Simplified for the focused memory system.
 """
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import NullPool
 from sqlalchemy import event
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -11,6 +10,7 @@ from datetime import datetime
 from typing import Optional
 import logging
 
+from .config import settings
 from .models import Base, MemoryVersion  # noqa: F401 - MemoryVersion imported for table creation
 
 logger = logging.getLogger(__name__)
@@ -42,10 +42,10 @@ class DatabaseManager:
             self._engine = create_async_engine(
                 self.db_url,
                 connect_args={"check_same_thread": False},
-                # Use NullPool for SQLite to avoid connection issues across async contexts
-                # Each operation gets a fresh connection
-                poolclass=NullPool,
-                pool_pre_ping=True,
+                # Keep connections open between sessions: opening one and
+                # running the PRAGMAs below costs more than most queries.
+                # A local file connection cannot go stale, so no pre-ping.
+                pool_size=settings.sqlite_pool_size,
             )
 
             # Configure SQLite PRAGMAs for performance and reliability
@@ -25,8 +25,8 @@ logger = logging.getLogger(__name__)
 class IdleDreamScheduler:
     """Monitors tool call activity and triggers dreaming during idle periods.
 
-    The scheduler runs a background asyncio.Task that polls for idle timeout
-    expiry. When the user has been idle for `idle_timeout` seconds, it invokes
+    The scheduler runs a background asyncio.Task that sleeps until the idle
+    deadline. When the user has been idle for `idle_timeout` seconds, it invokes
     the registered dream callback. If the user returns (a tool call arrives),
     the `user_active` Event is set, signaling dream strategies to yield.
 
@@ -141,8 +141,11 @@ class IdleDreamScheduler:
                     remaining = self._idle_timeout - elapsed
                     if remaining <= 0:
                         break
-                    # Poll with 1s granularity to auto-correct drift
-                    await asyncio.sleep(min(remaining, 1.0))
+                    # Sleep until the deadline as of the last tool call; a
+                    # call in the meantime pushes it out and we sleep again.
+                    # The monotonic clock cannot drift, so there is no need
+                    # to wake up in between.
+                    await asyncio.sleep(remaining)
 
                 if not self._running:
                     break
@@ -109,7 +109,7 @@ class FailedDecisionReview(DreamStrategy):
         evidence, and persists actionable insights.
         """
         session.strategies_run.append(self.name)
-        user_name = getattr(ctx, "current_user", "default") or "default"
+        user_name = ctx.current_user or "default"
         self._logger.info(
             "Dream session %s: Starting FailedDecisionReview (user_name=%s)",
             session.session_id, user_name,
@@ -356,7 +356,7 @@ class ConnectionDiscovery(DreamStrategy):
         scheduler: "IdleDreamScheduler",
     ) -> DreamSession:
         session.strategies_run.append(self.name)
-        user_name = getattr(ctx, "current_user", "default") or "default"
+        user_name = ctx.current_user or "default"
         self._logger.info(
             "Dream session %s: Starting ConnectionDiscovery (user_name=%s)",
             session.session_id, user_name,
@@ -510,7 +510,7 @@ class CommunityRefresh(DreamStrategy):
         scheduler: "IdleDreamScheduler",
     ) -> DreamSession:
         session.strategies_run.append(self.name)
-        user_name = getattr(ctx, "current_user", "default") or "default"
+        user_name = ctx.current_user or "default"
         self._logger.info(
             "Dream session %s: Starting CommunityRefresh (user_name=%s)",
             session.session_id, user_name,
@@ -641,7 +641,7 @@ class PendingOutcomeResolver(DreamStrategy):
     ) -> DreamSession:
         """Execute the PendingOutcomeResolver strategy."""
         session.strategies_run.append(self.name)
-        user_name = getattr(ctx, "current_user", "default") or "default"
+        user_name = ctx.current_user or "default"
         self._logger.info(
             "Dream session %s: Starting PendingOutcomeResolver (dry_run=%s, user_name=%s)",
             session.session_id, self._dry_run, user_name,
@@ -27,25 +27,34 @@ NEGATIVE_EMOTIONS = frozenset({
     "irritated", "dreading",
 })
 
-# Pre-compile explicit emotion patterns
-_EXPLICIT_PATTERNS = []
-for _word in POSITIVE_EMOTIONS | NEGATIVE_EMOTIONS:
-    _valence = "positive" if _word in POSITIVE_EMOTIONS else "negative"
-    _EXPLICIT_PATTERNS.append((
-        re.compile(r"\bi(?:\'m| am) (?:so |really |very |super )?" + _word + r"\b", re.IGNORECASE),
-        _word,
-        _valence,
-    ))
-    _EXPLICIT_PATTERNS.append((
-        re.compile(r"\bi feel (?:so |really |very )?" + _word + r"\b", re.IGNORECASE),
-        _word,
-        _valence,
-    ))
+# Valence lookup for every explicit emotion word
+_VALENCE: Dict[str, str] = {
+    **{w: "positive" for w in POSITIVE_EMOTIONS},
+    **{w: "negative" for w in NEGATIVE_EMOTIONS},
+}
+
+# Pre-compile explicit emotion patterns as two alternations (one per template)
+_EMOTION_ALTERNATION = "|".join(
+    re.escape(w) for w in sorted(_VALENCE, key=len, reverse=True)
+)
+_IM_RE = re.compile(
+    r"\bi(?:\'m| am) (?:so |really |very |super )?(?P<word>" + _EMOTION_ALTERNATION + r")\b",
+    re.IGNORECASE,
+)
+_FEEL_RE = re.compile(
+    r"\bi feel (?:so |really |very )?(?P<word>" + _EMOTION_ALTERNATION + r")\b",
+    re.IGNORECASE,
+)
+
+# Shortest possible explicit statement ("i'm sad"); shorter content can skip both scans
+_MIN_EXPLICIT_LENGTH = len("i'm ") + min(len(w) for w in _VALENCE)
 
 
 # --- Emphasis patterns ---
 
-CAPS_PATTERN = re.compile(r"\b[A-Z]{3,}\b")
+# Same matches as \b[A-Z]{3,}\b, but leading with a character class lets re
+# skip ahead to the next capital instead of testing \b at every position
+CAPS_PATTERN = re.compile(r"[A-Z](?<!\w[A-Z])[A-Z]{2,}(?!\w)")
 MULTI_EXCLAIM_PATTERN = re.compile(r"!{2,}")
 
 COMMON_ACRONYMS = frozenset({
@@ -73,6 +82,16 @@ POSITIVE_TOPICS = frozenset({
     "anniversary", "achievement", "award", "raise",
 })
 
+# Longest phrases first so multi-word topics like "laid off" are matchable
+_HEAVY_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(HEAVY_TOPICS, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)
+_POS_TOPIC_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(POSITIVE_TOPICS, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)
+
 
 def detect_emotion(content: str) -> Optional[Dict]:
     """Detect emotional context from text content.
@@ -87,14 +106,24 @@ def detect_emotion(content: str) -> Optional[Dict]:
         return None
 
     # 1. Explicit emotional statements (confidence 0.95)
-    for pattern, word, valence in _EXPLICIT_PATTERNS:
-        if pattern.search(content):
-            return {
-                "emotion_label": word,
-                "valence": valence,
-                "source": "explicit",
-                "confidence": 0.95,
-            }
+    match = None
+    if len(content) >= _MIN_EXPLICIT_LENGTH:
+        match = _IM_RE.search(content) or _FEEL_RE.search(content)
+    if match:
+        word = match.group("word").lower()
+        if word not in _VALENCE:
+            # IGNORECASE also matches non-ASCII case variants (e.g. "ſ" for "s")
+            # that lower() leaves alone; recover the canonical emotion word.
+            word = next(
+                w for w in _VALENCE
+                if re.fullmatch(w, match.group("word"), re.IGNORECASE)
+            )
+        return {
+            "emotion_label": word,
+            "valence": _VALENCE[word],
+            "source": "explicit",
+            "confidence": 0.95,
+        }
 
     # 2. Emphasis patterns (confidence 0.65-0.85)
     caps_matches = CAPS_PATTERN.findall(content)
@@ -127,15 +156,14 @@ def detect_emotion(content: str) -> Optional[Dict]:
             }
 
     # 3. Topic sentiment (confidence 0.60)
-    content_words = set(re.findall(r"\b\w+\b", content.lower()))
-    if content_words & HEAVY_TOPICS:
+    if _HEAVY_RE.search(content):
         return {
             "emotion_label": "distressed",
             "valence": "negative",
             "source": "topic",
             "confidence": 0.60,
         }
-    if content_words & POSITIVE_TOPICS:
+    if _POS_TOPIC_RE.search(content):
         return {
             "emotion_label": "positive",
             "valence": "positive",
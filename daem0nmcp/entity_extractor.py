@@ -9,7 +9,7 @@ Extracts conversational entities (Phase 7: personal knowledge graph):
 
 import re
 import logging
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,7 @@ PERSONAL_PATTERNS = {
 # Backward compatibility alias
 PATTERNS = PERSONAL_PATTERNS
 
+
 # Common words that are NOT entities (false positive filter)
 STOP_WORDS = frozenset({
     "the", "and", "for", "with", "use", "get", "set", "add", "new",
@@ -70,6 +71,9 @@ STOP_WORDS = frozenset({
     "so", "because", "since", "after", "before",
 })
 
+# Names longer than every stop word can skip the STOP_WORDS lookup
+_MAX_STOP_WORD_LEN = max(len(word) for word in STOP_WORDS)
+
 
 class EntityExtractor:
     """
@@ -82,10 +86,36 @@ class EntityExtractor:
       These create aliases linking to person entities, not standalone entities.
     """
 
+    # Shared by every instance; only extractors with custom patterns get a copy
+    patterns: Dict[str, re.Pattern] = PERSONAL_PATTERNS
+
     def __init__(self, custom_patterns: Dict[str, re.Pattern] = None):
-        self.patterns = {**PERSONAL_PATTERNS}
         if custom_patterns:
-            self.patterns.update(custom_patterns)
+            self.patterns = {**PERSONAL_PATTERNS, **custom_patterns}
+
+    def _iter_matches(self, text: str) -> Iterator[Tuple[str, re.Match, str]]:
+        """Yield (entity_type, match, captured name) for every pattern hit.
+
+        Person hits that only repeat a pet name ("my dog Max") are skipped so
+        the name is extracted once, as a pet.
+        """
+        pet_pattern = self.patterns.get("pet")
+        pet_matches = list(pet_pattern.finditer(text)) if pet_pattern else []
+        pet_name_spans = {match.span(1) for match in pet_matches if match.groups()}
+
+        for entity_type, pattern in self.patterns.items():
+            matches = pet_matches if entity_type == "pet" else pattern.finditer(text)
+            for match in matches:
+                # Get the captured group or full match
+                if not match.groups():
+                    yield entity_type, match, match.group(0)
+                    continue
+                if entity_type == "person" and pet_name_spans and any(
+                    start <= match.start(1) and match.end(1) <= end
+                    for start, end in pet_name_spans
+                ):
+                    continue
+                yield entity_type, match, match.group(1)
 
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -100,45 +130,38 @@ class EntityExtractor:
         if not text:
             return []
 
-        entities = []
-        seen = set()  # Dedup by (type, name)
-
-        for entity_type, pattern in self.patterns.items():
-            for match in pattern.finditer(text):
-                # Get the captured group or full match
-                if match.groups():
-                    name = match.group(1)
-                else:
-                    name = match.group(0)
-
-                # Clean up
-                name = name.strip()
-
-                # Skip empty, too short, or stop words
-                if not name or len(name) < 2:
-                    continue
-                if name.lower() in STOP_WORDS:
-                    continue
-
-                # Dedup
-                key = (entity_type, name.lower())
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                # Get context snippet (50 chars around match)
-                start = max(0, match.start() - 25)
-                end = min(len(text), match.end() + 25)
-                context = "..." + text[start:end] + "..."
-
-                entities.append({
-                    "type": entity_type,
-                    "name": name,
-                    "context": context,
-                    "position": match.start()
-                })
-
-        return entities
+        # Dedup by (type, lowered name); dict insertion order keeps match order
+        entities: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        for entity_type, match, name in self._iter_matches(text):
+            # Clean up
+            name = name.strip()
+
+            # Skip empty, too short, or stop words
+            if not name or len(name) < 2:
+                continue
+            name_lower = name.lower()
+            if len(name) <= _MAX_STOP_WORD_LEN and name_lower in STOP_WORDS:
+                continue
+
+            # Dedup
+            key = (entity_type, name_lower)
+            if key in entities:
+                continue
+
+            # Get context snippet (50 chars around match)
+            start = max(0, match.start() - 25)
+            end = min(len(text), match.end() + 25)
+            context = f"...{text[start:end]}..."
+
+            entities[key] = {
+                "type": entity_type,
+                "name": name,
+                "context": context,
+                "position": match.start()
+            }
+
+        return list(entities.values())
 
     def extract_concepts(self, text: str, min_frequency: int = 1) -> List[Dict[str, Any]]:
         """
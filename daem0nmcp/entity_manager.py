@@ -10,9 +10,11 @@ Handles:
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timezone
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .database import DatabaseManager
 from .models import (
@@ -21,6 +23,7 @@ from .models import (
 )
 from .entity_extractor import EntityExtractor
 from .graph.entity_resolver import EntityResolver
+from .graph.knowledge_graph import GraphDelta
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +67,8 @@ class EntityManager:
             user_name: Which user this memory belongs to (multi-user isolation)
 
         Returns:
-            Summary of extraction results
+            Summary of extraction results, with the graph_delta to mirror
+            into a loaded KnowledgeGraph
         """
         # Combine content and rationale for extraction
         text = content
@@ -83,91 +87,182 @@ class EntityManager:
                 "entities_found": 0,
                 "refs_created": 0,
                 "aliases_created": 0,
+                "graph_delta": GraphDelta(),
             }
 
-        refs_created = 0
-        aliases_created = 0
+        async with self.db.get_session() as session:
+            return await self._store_extracted(
+                session, memory_id, extracted, user_id, user_name
+            )
 
-        # Separate person entities from relationship refs
-        person_entities = [e for e in extracted if e["type"] == "person"]
-        relationship_refs = [e for e in extracted if e["type"] == "relationship_ref"]
-        # Non-relationship entities to process normally (person, pet, etc.)
-        normal_entities = [e for e in extracted if e["type"] != "relationship_ref"]
+    async def process_memories_batch(
+        self,
+        memories: List[Dict[str, Any]],
+        user_id: str,
+        user_name: str = "default",
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract entities from many memories in a single transaction.
 
-        async with self.db.get_session() as session:
-            # Process normal entities (person, pet, etc.)
-            person_entity_map = {}  # name.lower() -> entity object
-            for entity_data in normal_entities:
-                entity = await self._get_or_create_entity(
-                    session,
-                    user_id=user_id,
-                    entity_type=entity_data["type"],
-                    name=entity_data["name"],
-                    user_name=user_name,
-                )
+        Equivalent to calling process_memory() for each item, but warms the
+        resolver cache once and commits once. Memories are processed in order
+        rather than concurrently: SQLite serializes writers anyway, and
+        sequential resolution lets later memories reuse entities created by
+        earlier ones instead of racing to create duplicates.
 
-                # Track person entities for alias creation
-                if entity_data["type"] == "person":
-                    person_entity_map[entity_data["name"].lower()] = entity
+        Args:
+            memories: List of dicts, each with:
+                - memory_id: Memory to process
+                - content: Memory content to extract from
+                - rationale: (optional) Rationale to also extract from
+            user_id: Project these belong to
+            user_name: Which user these memories belong to
 
-                # Create reference if not exists
-                existing_ref = await session.execute(
-                    select(MemoryEntityRef).where(
-                        MemoryEntityRef.memory_id == memory_id,
-                        MemoryEntityRef.entity_id == entity.id
-                    )
-                )
-                if not existing_ref.scalar_one_or_none():
-                    ref = MemoryEntityRef(
-                        memory_id=memory_id,
-                        entity_id=entity.id,
-                        relationship="mentions",
-                        context_snippet=entity_data.get("context")
-                    )
-                    session.add(ref)
-                    refs_created += 1
+        Returns:
+            One extraction summary per memory, in input order
+        """
+        await self.resolver.ensure_cache_loaded(user_id)
+
+        results = []
+        async with self.db.get_session() as session:
+            for mem in memories:
+                text = mem["content"]
+                if mem.get("rationale"):
+                    text += " " + mem["rationale"]
+                results.append(await self._store_extracted(
+                    session, mem["memory_id"], self.extractor.extract_all(text),
+                    user_id, user_name,
+                ))
+        return results
+
+    async def _store_extracted(
+        self,
+        session,
+        memory_id: int,
+        extracted: List[Dict[str, Any]],
+        user_id: str,
+        user_name: str,
+    ) -> Dict[str, Any]:
+        """Resolve extracted entities and store their refs and aliases in ``session``."""
+        refs_created = 0
+        aliases_created = 0
+        delta = GraphDelta()
+
+        # Separate person entities from relationship refs in one pass.
+        # Non-relationship entities (person, pet, etc.) are processed normally.
+        person_entities, relationship_refs, normal_entities = [], [], []
+        for entity_data in extracted:
+            entity_type = entity_data["type"]
+            if entity_type == "relationship_ref":
+                relationship_refs.append(entity_data)
+                continue
+            if entity_type == "person":
+                person_entities.append(entity_data)
+            normal_entities.append(entity_data)
+
+        # Process normal entities (person, pet, etc.)
+        person_entity_map = {}  # name.lower() -> entity id
+        resolved = []  # (entity_data, entity_id) in extraction order
+        mention_increments = Counter()  # existing entity id -> new mentions
+        for entity_data in normal_entities:
+            entity_id, is_new = await self._get_or_create_entity(
+                session,
+                user_id=user_id,
+                entity_type=entity_data["type"],
+                name=entity_data["name"],
+                user_name=user_name,
+            )
+            resolved.append((entity_data, entity_id))
+            if is_new:
+                delta.added_entities.append({
+                    "id": entity_id,
+                    "entity_type": entity_data["type"],
+                    "name": entity_data["name"],
+                    "qualified_name": self.resolver.normalize(
+                        entity_data["name"], entity_data["type"]
+                    ),
+                    "user_id": user_id,
+                    "mention_count": 1,
+                    "user_name": user_name,
+                })
+            else:
+                mention_increments[entity_id] += 1
+
+            # Track person entities for alias creation
+            if entity_data["type"] == "person":
+                person_entity_map[entity_data["name"].lower()] = entity_id
+
+        await self._increment_mention_counts(session, mention_increments)
+        delta.mention_increments = dict(mention_increments)
+
+        # Create references; the unique (memory_id, entity_id) index makes
+        # reprocessing a no-op without an existence query first
+        if resolved:
+            ref_result = await session.execute(
+                sqlite_insert(MemoryEntityRef).values([
+                    {
+                        "memory_id": memory_id,
+                        "entity_id": entity_id,
+                        "relationship": "mentions",
+                        "context_snippet": entity_data.get("context"),
+                    }
+                    for entity_data, entity_id in resolved
+                ]).on_conflict_do_nothing()
+            )
+            refs_created += ref_result.rowcount
+            delta.added_refs = [
+                {"memory_id": memory_id, "entity_id": entity_id, "relationship": "mentions"}
+                for _, entity_id in resolved
+            ]
 
-            # Handle relationship_ref co-occurrence with person names
-            # If we found both person entities and relationship refs in the same memory,
-            # create aliases linking the person to the relationship reference
-            if person_entities and relationship_refs:
+        # Handle relationship_ref co-occurrence with person names
+        # If we found both person entities and relationship refs in the same memory,
+        # create aliases linking the person to the relationship reference
+        if person_entities and relationship_refs:
+            # Link every relationship ref to the first person entity found
+            # (most likely the referent). In "my sister Sarah", Sarah is the person
+            person_data = next(
+                (p for p in person_entities if p["name"].lower() in person_entity_map),
+                None,
+            )
+            if person_data is not None:
+                person_entity_id = person_entity_map[person_data["name"].lower()]
+                alias_result = await session.execute(
+                    sqlite_insert(EntityAlias).values([
+                        {
+                            "entity_id": person_entity_id,
+                            "alias": rel_ref["name"].lower(),
+                            "alias_type": "relationship",
+                            "user_name": user_name,
+                        }
+                        for rel_ref in relationship_refs
+                    ]).on_conflict_do_nothing()
+                )
+                aliases_created += alias_result.rowcount
+                delta.added_aliases = [
+                    {
+                        "alias": rel_ref["name"].lower(),
+                        "user_name": user_name,
+                        "entity_id": person_entity_id,
+                    }
+                    for rel_ref in relationship_refs
+                ]
                 for rel_ref in relationship_refs:
-                    rel_name = rel_ref["name"]  # e.g., "my sister"
-                    # Link to the first person entity found (most likely the referent)
-                    # In "my sister Sarah", Sarah is the person
-                    for person_data in person_entities:
-                        person_name_lower = person_data["name"].lower()
-                        if person_name_lower in person_entity_map:
-                            person_entity = person_entity_map[person_name_lower]
-                            # Check if alias already exists
-                            existing_alias = await session.execute(
-                                select(EntityAlias).where(
-                                    EntityAlias.entity_id == person_entity.id,
-                                    EntityAlias.alias == rel_name.lower(),
-                                    EntityAlias.user_name == user_name,
-                                )
-                            )
-                            if not existing_alias.scalar_one_or_none():
-                                alias = EntityAlias(
-                                    entity_id=person_entity.id,
-                                    alias=rel_name.lower(),
-                                    alias_type="relationship",
-                                    user_name=user_name,
-                                )
-                                session.add(alias)
-                                aliases_created += 1
-                                logger.debug(
-                                    f"Created alias: '{rel_name}' -> entity:{person_entity.id} "
-                                    f"({person_data['name']})"
-                                )
-                            # Only link to the first matching person (most proximate)
-                            break
+                    self.resolver.cache_alias(
+                        user_id, user_name, rel_ref["name"], person_entity_id
+                    )
+                if alias_result.rowcount:
+                    logger.debug(
+                        f"Created {alias_result.rowcount} alias(es) -> entity:{person_entity_id} "
+                        f"({person_data['name']})"
+                    )
 
         return {
             "memory_id": memory_id,
             "entities_found": len(extracted),
             "refs_created": refs_created,
             "aliases_created": aliases_created,
+            "graph_delta": delta,
         }
 
     async def _get_or_create_entity(
@@ -177,9 +272,14 @@ class EntityManager:
         entity_type: str,
         name: str,
         user_name: str = "default",
-    ) -> ExtractedEntity:
-        """Get existing entity or create new one using resolver."""
-        entity_id, is_new = await self.resolver.resolve(
+    ) -> Tuple[int, bool]:
+        """Get existing entity or create new one using resolver.
+
+        Returns:
+            (entity_id, is_new) tuple. Mention counts of existing entities are
+            bumped separately via _increment_mention_counts.
+        """
+        return await self.resolver.resolve(
             name=name,
             entity_type=entity_type,
             user_id=user_id,
@@ -187,15 +287,22 @@ class EntityManager:
             user_name=user_name,
         )
 
-        # Get the entity object
-        entity = await session.get(ExtractedEntity, entity_id)
-
-        if not is_new:
-            # Increment mention count for existing entity
-            entity.mention_count += 1
-            entity.updated_at = datetime.now(timezone.utc)
-
-        return entity
+    async def _increment_mention_counts(self, session, increments: Counter) -> None:
+        """Bump mention_count for existing entities with one UPDATE per increment size."""
+        ids_by_increment: Dict[int, List[int]] = {}
+        for entity_id, increment in increments.items():
+            ids_by_increment.setdefault(increment, []).append(entity_id)
+
+        now = datetime.now(timezone.utc)
+        for increment, entity_ids in ids_by_increment.items():
+            await session.execute(
+                update(ExtractedEntity)
+                .where(ExtractedEntity.id.in_(entity_ids))
+                .values(
+                    mention_count=ExtractedEntity.mention_count + increment,
+                    updated_at=now,
+                )
+            )
 
     async def add_alias(
         self,
@@ -334,20 +441,61 @@ class EntityManager:
         This enables queries like "show everything related to UserAuth".
         """
         async with self.db.get_session() as session:
-            # Find the entity (scoped to user_name)
-            query = select(ExtractedEntity).where(
-                ExtractedEntity.user_id == user_id,
-                ExtractedEntity.user_name == user_name,
-                or_(
-                    ExtractedEntity.name == entity_name,
-                    ExtractedEntity.qualified_name == entity_name
+            # Matching entities (scoped to user_name) joined to their memories
+            # in one query; outer joins keep entities with no memories so
+            # "found" still reflects the entity lookup. Only the serialized
+            # Memory columns are selected (no ORM objects, no embeddings).
+            query = (
+                select(
+                    ExtractedEntity.id,
+                    ExtractedEntity.entity_type,
+                    ExtractedEntity.mention_count,
+                    Memory.id,
+                    Memory.category,
+                    Memory.content,
+                    Memory.rationale,
+                    Memory.tags,
+                    Memory.outcome,
+                    Memory.worked,
+                    Memory.created_at,
+                )
+                .select_from(ExtractedEntity)
+                .outerjoin(MemoryEntityRef, MemoryEntityRef.entity_id == ExtractedEntity.id)
+                .outerjoin(Memory, Memory.id == MemoryEntityRef.memory_id)
+                .where(
+                    ExtractedEntity.user_id == user_id,
+                    ExtractedEntity.user_name == user_name,
+                    or_(
+                        ExtractedEntity.name == entity_name,
+                        ExtractedEntity.qualified_name == entity_name
+                    )
                 )
             )
             if entity_type:
                 query = query.where(ExtractedEntity.entity_type == entity_type)
 
-            result = await session.execute(query)
-            entities = result.scalars().all()
+            # Stream in batches: a popular entity can reference thousands of
+            # memories, and rows are folded into the dicts below as they arrive.
+            result = await session.stream(query.execution_options(yield_per=256))
+
+            entities: Dict[int, Tuple[str, int]] = {}
+            memories: Dict[int, Dict[str, Any]] = {}
+            async for (
+                entity_id, e_type, mention_count,
+                memory_id, category, content, rationale, tags, outcome, worked, created_at,
+            ) in result:
+                entities[entity_id] = (e_type, mention_count)
+                if memory_id is not None and memory_id not in memories:
+                    memories[memory_id] = {
+                        "id": memory_id,
+                        "category": category,
+                        "content": content,
+                        "rationale": rationale,
+                        "tags": tags,
+                        "outcome": outcome,
+                        "worked": worked,
+                        "created_at": created_at.isoformat() if created_at else None
+                    }
 
             if not entities:
                 return {
@@ -356,49 +504,12 @@ class EntityManager:
                     "memories": []
                 }
 
-            # Get all memory IDs that reference these entities
-            entity_ids = [e.id for e in entities]
-            refs_result = await session.execute(
-                select(MemoryEntityRef).where(
-                    MemoryEntityRef.entity_id.in_(entity_ids)
-                )
-            )
-            refs = refs_result.scalars().all()
-            memory_ids = list(set(r.memory_id for r in refs))
-
-            # Get full memory content
-            if not memory_ids:
-                return {
-                    "entity_name": entity_name,
-                    "found": True,
-                    "entity_types": [e.entity_type for e in entities],
-                    "mention_count": sum(e.mention_count for e in entities),
-                    "memories": []
-                }
-
-            memories_result = await session.execute(
-                select(Memory).where(Memory.id.in_(memory_ids))
-            )
-            memories = memories_result.scalars().all()
-
             return {
                 "entity_name": entity_name,
                 "found": True,
-                "entity_types": [e.entity_type for e in entities],
-                "mention_count": sum(e.mention_count for e in entities),
-                "memories": [
-                    {
-                        "id": m.id,
-                        "category": m.category,
-                        "content": m.content,
-                        "rationale": m.rationale,
-                        "tags": m.tags,
-                        "outcome": m.outcome,
-                        "worked": m.worked,
-                        "created_at": m.created_at.isoformat() if m.created_at else None
-                    }
-                    for m in memories
-                ]
+                "entity_types": [e_type for e_type, _ in entities.values()],
+                "mention_count": sum(count or 0 for _, count in entities.values()),
+                "memories": list(memories.values())
             }
 
     async def get_popular_entities(
@@ -7,7 +7,7 @@ from .contradiction import (
     invalidate_contradicted_facts,
 )
 from .entity_resolver import EntityResolver
-from .knowledge_graph import KnowledgeGraph
+from .knowledge_graph import GraphDelta, KnowledgeGraph
 from .leiden import LeidenConfig, get_community_stats, run_leiden_on_networkx
 from .summarizer import CommunitySummarizer, SummaryConfig
 from .temporal import (
@@ -25,6 +25,7 @@ from .traversal import (
 
 __all__ = [
     "KnowledgeGraph",
+    "GraphDelta",
     "EntityResolver",
     "run_leiden_on_networkx",
     "LeidenConfig",
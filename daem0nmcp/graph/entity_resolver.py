@@ -1,30 +1,84 @@
 """Entity resolution and canonicalization for knowledge graph."""
 
+import asyncio
 import re
+import sys
 import logging
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import func, literal, select, union_all
 
 from ..database import DatabaseManager
 from ..models import ExtractedEntity, EntityAlias
 
 logger = logging.getLogger(__name__)
 
+# Per-project cap on cached entity ids; least recently used entries are
+# evicted first and fall back to the database on their next lookup.
+DEFAULT_MAX_CACHE_SIZE = 50_000
+
+_TITLE_RE = re.compile(r'^(?:Dr|Mr|Mrs|Ms|Prof)\.?\s+', re.IGNORECASE)
+_POSSESSIVE_RE = re.compile(r'^(?:my|his|her|their|our)\s+', re.IGNORECASE)
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+
+
+def _normalize_person(name: str) -> str:
+    # Strip titles and lowercase
+    return _TITLE_RE.sub('', name).lower()
+
+
+def _normalize_relationship_ref(name: str) -> str:
+    # Strip possessive and lowercase: "my sister" -> "sister"
+    return _POSSESSIVE_RE.sub('', name).lower()
+
+
+def _normalize_function(name: str) -> str:
+    # Convert camelCase to snake_case, then lowercase (legacy)
+    return _CAMEL_RE.sub(r'\1_\2', name).lower()
+
+
+def _normalize_file(name: str) -> str:
+    name = name.replace("\\", "/")
+    if name.startswith("./"):
+        name = name[2:]
+    return name.lower()
+
+
+def _normalize_concept(name: str) -> str:
+    return name.strip("'\"").lower()
+
+
+# Types not listed here (pet, place, organization, event, class, module,
+# variable, and anything unknown) are simply lowercased.
+_NORMALIZERS = {
+    "person": _normalize_person,
+    "relationship_ref": _normalize_relationship_ref,
+    "function": _normalize_function,
+    "file": _normalize_file,
+    "concept": _normalize_concept,
+}
+
 
 class EntityResolver:
     """
     Canonicalizes entities to prevent duplicates and enable merging.
 
     Uses type+normalized_name as the uniqueness key.
-    Maintains an in-memory cache for fast lookups during batch processing.
+    Maintains a bounded, per-project LRU cache for fast lookups during
+    batch processing.
     Checks the entity_aliases table before creating new entities (Phase 7).
     """
 
-    def __init__(self, db: DatabaseManager):
+    def __init__(self, db: DatabaseManager, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE):
         self.db = db
-        self._canonical_cache: Dict[str, int] = {}  # "project:type:normalized_name" -> entity_id
+        self.max_cache_size = max_cache_size
+        # project -> LRU of (type, normalized_name) -> entity_id
+        self._canonical_cache: Dict[str, "OrderedDict[Tuple[str, str], int]"] = {}
+        # project -> (user_name, alias_lower) -> entity_id
+        self._alias_cache: Dict[str, Dict[Tuple[str, str], int]] = {}
         self._loaded_projects: set = set()  # Track which projects have been loaded
+        self._load_locks: Dict[str, asyncio.Lock] = {}  # Per-project warmup locks
 
     def normalize(self, name: str, entity_type: str) -> str:
         """
@@ -46,75 +100,98 @@ class EntityResolver:
         if not name:
             return ""
 
-        # Start with basic normalization
-        normalized = name.strip()
-
-        if entity_type == "person":
-            # Strip titles and lowercase
-            normalized = re.sub(r'^(?:Dr|Mr|Mrs|Ms|Prof)\.?\s+', '', normalized, flags=re.IGNORECASE)
-            normalized = normalized.lower()
-        elif entity_type == "pet":
-            normalized = normalized.lower()
-        elif entity_type == "place":
-            normalized = normalized.lower()
-        elif entity_type == "organization":
-            normalized = normalized.lower()
-        elif entity_type == "relationship_ref":
-            # Strip possessive and lowercase: "my sister" -> "sister"
-            normalized = re.sub(r'^(?:my|his|her|their|our)\s+', '', normalized, flags=re.IGNORECASE)
-            normalized = normalized.lower()
-        elif entity_type == "event":
-            normalized = normalized.lower()
-        elif entity_type == "function":
-            # Convert camelCase to snake_case, then lowercase (legacy)
-            normalized = re.sub(r'([a-z])([A-Z])', r'\1_\2', normalized)
-            normalized = normalized.lower()
-        elif entity_type == "class":
-            normalized = normalized.lower()
-        elif entity_type == "file":
-            normalized = normalized.replace("\\", "/")
-            if normalized.startswith("./"):
-                normalized = normalized[2:]
-            normalized = normalized.lower()
-        elif entity_type == "module":
-            normalized = normalized.lower()
-        elif entity_type == "variable":
-            normalized = normalized.lower()
-        elif entity_type == "concept":
-            normalized = normalized.strip("'\"")
-            normalized = normalized.lower()
-        else:
-            normalized = normalized.lower()
-
-        return normalized
-
-    def _cache_key(self, user_id: str, entity_type: str, normalized_name: str) -> str:
-        """Generate cache key from project, type, and normalized name."""
-        return f"{user_id}:{entity_type}:{normalized_name}"
+        normalizer = _NORMALIZERS.get(entity_type, str.lower)
+        return normalizer(name.strip())
+
+    def _cache_get(self, user_id: str, key: Tuple[str, str]) -> Optional[int]:
+        """Look up a cached entity id, marking it most recently used."""
+        project_cache = self._canonical_cache.get(user_id)
+        if project_cache is None:
+            return None
+        entity_id = project_cache.get(key)
+        if entity_id is not None:
+            project_cache.move_to_end(key)
+        return entity_id
+
+    def _cache_put(self, user_id: str, key: Tuple[str, str], entity_id: int) -> None:
+        """Cache an entity id, evicting the least recently used entry if full."""
+        project_cache = self._canonical_cache.setdefault(user_id, OrderedDict())
+        project_cache[key] = entity_id
+        project_cache.move_to_end(key)
+        if len(project_cache) > self.max_cache_size:
+            project_cache.popitem(last=False)
 
     async def ensure_cache_loaded(self, user_id: str):
-        """Load existing entities into cache for fast lookup."""
+        """Load existing entities into cache for fast lookup.
+
+        Projects larger than ``max_cache_size`` only warm their most
+        mentioned entities; the rest are resolved from the database.
+        """
         if user_id in self._loaded_projects:
             return
 
+        # Concurrent callers for a cold project wait for a single warmup
+        lock = self._load_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            # Another task may have finished loading while we waited
+            if user_id in self._loaded_projects:
+                return
+            await self._load_project(user_id)
+            # Loaded projects take the fast path above, so the lock can go
+            self._load_locks.pop(user_id, None)
+
+    async def _load_project(self, user_id: str) -> None:
+        """Populate the entity and alias caches for one project."""
         async with self.db.get_session() as session:
+            # Only the columns the cache needs; no ORM entity hydration
             result = await session.execute(
-                select(ExtractedEntity).where(
+                select(
+                    ExtractedEntity.id,
+                    ExtractedEntity.entity_type,
+                    ExtractedEntity.name,
+                    ExtractedEntity.qualified_name,
+                ).where(
                     ExtractedEntity.user_id == user_id
-                )
+                ).order_by(
+                    ExtractedEntity.mention_count.desc()
+                ).limit(self.max_cache_size)
             )
-            entities = result.scalars().all()
 
             count = 0
-            for entity in entities:
+            # Least mentioned first so the most mentioned end up most recent
+            for entity_id, entity_type, name, qualified_name in reversed(result.all()):
                 # Use qualified_name if set, otherwise normalize the name
-                normalized = entity.qualified_name or self.normalize(entity.name, entity.entity_type)
-                key = self._cache_key(user_id, entity.entity_type, normalized)
-                self._canonical_cache[key] = entity.id
+                normalized = qualified_name or self.normalize(name, entity_type)
+                # Each row brings its own copy of the type string; interning
+                # keeps one shared object per type across the whole cache
+                self._cache_put(user_id, (sys.intern(entity_type), normalized), entity_id)
                 count += 1
 
+            alias_result = await session.execute(
+                select(
+                    EntityAlias.user_name,
+                    func.lower(EntityAlias.alias),
+                    EntityAlias.entity_id,
+                ).join(
+                    ExtractedEntity, ExtractedEntity.id == EntityAlias.entity_id
+                ).where(
+                    ExtractedEntity.user_id == user_id
+                )
+            )
+            self._alias_cache[user_id] = {
+                (alias_user, alias): entity_id
+                for alias_user, alias, entity_id in alias_result
+            }
+
         self._loaded_projects.add(user_id)
-        logger.debug(f"Loaded {count} entities for {user_id} into resolver cache")
+        logger.debug(
+            f"Loaded {count} entities and {len(self._alias_cache[user_id])} aliases "
+            f"for {user_id} into resolver cache"
+        )
+
+    def cache_alias(self, user_id: str, user_name: str, alias: str, entity_id: int) -> None:
+        """Record a newly stored alias so resolve() can skip the database for it."""
+        self._alias_cache.setdefault(user_id, {})[(user_name, alias.lower())] = entity_id
 
     async def resolve(
         self,
@@ -128,9 +205,10 @@ class EntityResolver:
         Resolve entity to canonical ID.
 
         Checks in order:
-        1. In-memory cache
+        1. In-memory caches (entities, then aliases)
         2. Alias table (Phase 7) -- resolves alternative references
         3. Database by name / qualified_name
+           (2 and 3 share a single query, ranked in that order)
         4. Create new entity
 
         Args:
@@ -144,54 +222,51 @@ class EntityResolver:
             (entity_id, is_new) tuple
         """
         normalized = self.normalize(name, entity_type)
-        cache_key = self._cache_key(user_id, entity_type, normalized)
+        cache_key = (entity_type, normalized)
 
         # Check cache first
-        if cache_key in self._canonical_cache:
-            return self._canonical_cache[cache_key], False
+        cached_id = self._cache_get(user_id, cache_key)
+        if cached_id is not None:
+            return cached_id, False
+
+        alias_id = self._alias_cache.get(user_id, {}).get((user_name, normalized))
+        if alias_id is not None:
+            self._cache_put(user_id, cache_key, alias_id)
+            return alias_id, False
 
         # Need to check/create in database
         async def do_resolve(sess):
-            # Check alias table for alternative references (Phase 7)
-            alias_result = await sess.execute(
-                select(EntityAlias).where(
-                    func.lower(EntityAlias.alias) == normalized,
-                    EntityAlias.user_name == user_name,
-                )
+            # Alias (Phase 7), exact name and qualified_name matches in one
+            # round trip; the rank column preserves that precedence order.
+            alias_q = select(
+                literal(0).label("rank"), EntityAlias.entity_id.label("entity_id")
+            ).where(
+                func.lower(EntityAlias.alias) == normalized,
+                EntityAlias.user_name == user_name,
             )
-            alias_match = alias_result.scalar_one_or_none()
-            if alias_match:
-                # Resolve to the canonical entity
-                self._canonical_cache[cache_key] = alias_match.entity_id
-                return alias_match.entity_id, False
-
-            # Check for existing entity with same type and normalized name
-            result = await sess.execute(
-                select(ExtractedEntity).where(
-                    ExtractedEntity.user_id == user_id,
-                    ExtractedEntity.entity_type == entity_type,
-                    func.lower(ExtractedEntity.name) == normalized
-                )
+            name_q = select(
+                literal(1).label("rank"), ExtractedEntity.id.label("entity_id")
+            ).where(
+                ExtractedEntity.user_id == user_id,
+                ExtractedEntity.entity_type == entity_type,
+                func.lower(ExtractedEntity.name) == normalized
             )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                self._canonical_cache[cache_key] = existing.id
-                return existing.id, False
-
-            # Also check qualified_name
+            qualified_q = select(
+                literal(2).label("rank"), ExtractedEntity.id.label("entity_id")
+            ).where(
+                ExtractedEntity.user_id == user_id,
+                ExtractedEntity.entity_type == entity_type,
+                ExtractedEntity.qualified_name == normalized
+            )
+            combined = union_all(alias_q, name_q, qualified_q).subquery()
             result = await sess.execute(
-                select(ExtractedEntity).where(
-                    ExtractedEntity.user_id == user_id,
-                    ExtractedEntity.entity_type == entity_type,
-                    ExtractedEntity.qualified_name == normalized
-                )
+                select(combined.c.entity_id).order_by(combined.c.rank).limit(1)
             )
-            existing = result.scalar_one_or_none()
+            existing_id = result.scalar_one_or_none()
 
-            if existing:
-                self._canonical_cache[cache_key] = existing.id
-                return existing.id, False
+            if existing_id is not None:
+                self._cache_put(user_id, cache_key, existing_id)
+                return existing_id, False
 
             # Create new entity
             new_entity = ExtractedEntity(
@@ -205,7 +280,7 @@ class EntityResolver:
             sess.add(new_entity)
             await sess.flush()
 
-            self._canonical_cache[cache_key] = new_entity.id
+            self._cache_put(user_id, cache_key, new_entity.id)
             logger.debug(f"Created new entity: {entity_type}:{name} (normalized: {normalized})")
             return new_entity.id, True
 
@@ -223,11 +298,10 @@ class EntityResolver:
                          If None, clear entire cache.
         """
         if user_id is not None:
-            prefix = f"{user_id}:"
-            keys_to_remove = [k for k in self._canonical_cache if k.startswith(prefix)]
-            for k in keys_to_remove:
-                del self._canonical_cache[k]
+            self._canonical_cache.pop(user_id, None)
+            self._alias_cache.pop(user_id, None)
             self._loaded_projects.discard(user_id)
         else:
             self._canonical_cache.clear()
+            self._alias_cache.clear()
             self._loaded_projects.clear()
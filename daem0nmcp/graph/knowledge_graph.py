@@ -16,7 +16,10 @@ Edge types:
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 
@@ -32,6 +35,68 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip while streaming the graph tables
+_LOAD_BATCH_SIZE = 5000
+
+# Memory ids bound per IN (...) clause when fetching query results
+_MEMORY_FETCH_CHUNK_SIZE = 500
+
+# Node id prefixes. Every node comes from _load_from_db with an integer id,
+# so ids are sliced off after the prefix rather than split and validated.
+_ENTITY_PREFIX = "entity:"
+_MEMORY_PREFIX = "memory:"
+_ENTITY_PREFIX_LEN = len(_ENTITY_PREFIX)
+_MEMORY_PREFIX_LEN = len(_MEMORY_PREFIX)
+
+# Relational-query words that match any connected entity of type "pet"
+_PET_WORDS = frozenset({
+    "dog", "cat", "pet", "bird", "fish", "hamster", "rabbit", "parrot", "turtle", "horse",
+})
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a label string so repeated values share one object."""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass
+class GraphDelta:
+    """
+    A batch of database changes to mirror into a loaded KnowledgeGraph.
+
+    Rows use the same shape _load_from_db reads. Edges are identified by
+    their (source id, target id) pair, as the graph holds one edge per pair.
+    An added entity whose node already exists replaces its attributes.
+
+    Attributes:
+        added_entities: Dicts with id, entity_type, name, qualified_name,
+            user_id, mention_count and user_name
+        removed_entity_ids: Entity ids to drop, with all their edges
+        removed_memory_ids: Memory ids to drop, with all their edges
+        added_refs: Dicts with memory_id, entity_id, relationship
+        removed_refs: (memory_id, entity_id) pairs
+        added_memory_relationships: Dicts with source_id, target_id,
+            relationship, description, confidence
+        removed_memory_relationships: (source_id, target_id) pairs
+        added_entity_relationships: Dicts with source_entity_id,
+            target_entity_id, relationship, description, confidence
+        removed_entity_relationships: (source_entity_id, target_entity_id) pairs
+        added_aliases: Dicts with alias, user_name, entity_id
+        mention_increments: Entity id -> mentions to add to mention_count
+    """
+
+    added_entities: List[Dict[str, Any]] = field(default_factory=list)
+    removed_entity_ids: List[int] = field(default_factory=list)
+    removed_memory_ids: List[int] = field(default_factory=list)
+    added_refs: List[Dict[str, Any]] = field(default_factory=list)
+    removed_refs: List[Tuple[int, int]] = field(default_factory=list)
+    added_memory_relationships: List[Dict[str, Any]] = field(default_factory=list)
+    removed_memory_relationships: List[Tuple[int, int]] = field(default_factory=list)
+    added_entity_relationships: List[Dict[str, Any]] = field(default_factory=list)
+    removed_entity_relationships: List[Tuple[int, int]] = field(default_factory=list)
+    added_aliases: List[Dict[str, Any]] = field(default_factory=list)
+    mention_increments: Dict[int, int] = field(default_factory=dict)
+
 
 class KnowledgeGraph:
     """
@@ -65,6 +130,20 @@ class KnowledgeGraph:
         self._db = db
         self._graph: nx.DiGraph = nx.DiGraph()
         self._loaded: bool = False
+        # Secondary indexes kept in node insertion order (dicts used as
+        # ordered sets so apply_delta can drop nodes in O(1))
+        self._entity_nodes_by_type: Dict[str, Dict[str, None]] = {}
+        self._memory_nodes: Dict[str, None] = {}
+        # (lowercased alias / entity name, user_name) -> entity id
+        self._alias_index: Dict[Tuple[str, str], int] = {}
+        self._name_index: Dict[Tuple[str, str], int] = {}
+        # entity id -> the name / alias keys above that resolve to it, so an
+        # entity can be unindexed without scanning either index
+        self._name_keys: Dict[int, Tuple[str, str]] = {}
+        self._alias_keys: Dict[int, Set[Tuple[str, str]]] = {}
+        # entity node id -> lowercased type / name for _find_connected_match
+        self._type_lower: Dict[str, str] = {}
+        self._name_lower: Dict[str, str] = {}
 
     async def ensure_loaded(self) -> None:
         """
@@ -87,9 +166,20 @@ class KnowledgeGraph:
         Use when database has been modified externally.
         """
         self._loaded = False
-        self._graph.clear()
         await self.ensure_loaded()
 
+    def _clear(self) -> None:
+        """Drop the graph and every index derived from it."""
+        self._graph.clear()
+        self._entity_nodes_by_type.clear()
+        self._memory_nodes.clear()
+        self._alias_index.clear()
+        self._name_index.clear()
+        self._name_keys.clear()
+        self._alias_keys.clear()
+        self._type_lower.clear()
+        self._name_lower.clear()
+
     async def _load_from_db(self) -> None:
         """
         Load entities and relationships from SQLite into NetworkX graph.
@@ -99,119 +189,333 @@ class KnowledgeGraph:
         2. MemoryEntityRef -> memory:{id} nodes + edges to entities
         3. MemoryRelationship -> edges between memory nodes
         4. EntityRelationship -> edges between entity nodes (Phase 7)
+        5. EntityAlias -> alias index for _resolve_reference (Phase 7)
         """
         from sqlalchemy import select
 
         from ..models import (
             ExtractedEntity, MemoryEntityRef, MemoryRelationship,
-            EntityRelationship as EntityRelModel,
+            EntityRelationship as EntityRelModel, EntityAlias,
         )
 
+        # Start from empty: callers such as MemoryManager.invalidate_graph_cache()
+        # only reset _loaded, and the indexes below are append-only
+        self._clear()
+
         async with self._db.get_session() as session:
+            # Column-only queries streamed in partitions: no ORM hydration
+            # and no full result list held alongside the graph being built.
+
             # 1. Load extracted entities as nodes
-            entity_result = await session.execute(select(ExtractedEntity))
-            entities = entity_result.scalars().all()
-
-            for entity in entities:
-                node_id = f"entity:{entity.id}"
-                self._graph.add_node(
-                    node_id,
-                    node_type="entity",
-                    entity_type=entity.entity_type,
-                    name=entity.name,
-                    qualified_name=entity.qualified_name,
-                    user_id=entity.user_id,
-                    mention_count=entity.mention_count,
-                )
+            entity_result = await session.stream(
+                select(
+                    ExtractedEntity.id,
+                    ExtractedEntity.entity_type,
+                    ExtractedEntity.name,
+                    ExtractedEntity.qualified_name,
+                    ExtractedEntity.user_id,
+                    ExtractedEntity.mention_count,
+                    ExtractedEntity.user_name,
+                ).order_by(ExtractedEntity.id).execution_options(yield_per=_LOAD_BATCH_SIZE)
+            )
 
-            logger.debug(f"Loaded {len(entities)} entity nodes")
+            entity_count = 0
+            async for rows in entity_result.partitions():
+                for row in rows:
+                    self._add_entity(*row)
+                entity_count += len(rows)
+
+            logger.debug(f"Loaded {entity_count} entity nodes")
 
             # 2. Load memory-entity references
             # This creates memory nodes and edges to entities
-            ref_result = await session.execute(select(MemoryEntityRef))
-            refs = ref_result.scalars().all()
-
-            memory_ids_seen: Set[int] = set()
-
-            for ref in refs:
-                memory_node_id = f"memory:{ref.memory_id}"
-                entity_node_id = f"entity:{ref.entity_id}"
+            ref_result = await session.stream(
+                select(
+                    MemoryEntityRef.memory_id,
+                    MemoryEntityRef.entity_id,
+                    MemoryEntityRef.relationship,
+                ).execution_options(yield_per=_LOAD_BATCH_SIZE)
+            )
 
-                # Add memory node if not seen
-                if ref.memory_id not in memory_ids_seen:
-                    self._graph.add_node(
-                        memory_node_id,
-                        node_type="memory",
-                    )
-                    memory_ids_seen.add(ref.memory_id)
-
-                # Add edge from memory to entity
-                if self._graph.has_node(entity_node_id):
-                    self._graph.add_edge(
-                        memory_node_id,
-                        entity_node_id,
-                        edge_type="references",
-                        relationship=ref.relationship,
-                        context_snippet=ref.context_snippet,
-                    )
+            ref_count = 0
+            async for rows in ref_result.partitions():
+                for row in rows:
+                    self._add_reference(*row)
+                ref_count += len(rows)
 
-            logger.debug(f"Loaded {len(refs)} memory-entity references")
+            logger.debug(f"Loaded {ref_count} memory-entity references")
 
             # 3. Load memory-memory relationships
-            rel_result = await session.execute(select(MemoryRelationship))
-            relationships = rel_result.scalars().all()
-
-            for rel in relationships:
-                source_node = f"memory:{rel.source_id}"
-                target_node = f"memory:{rel.target_id}"
-
-                # Ensure both memory nodes exist
-                if rel.source_id not in memory_ids_seen:
-                    self._graph.add_node(source_node, node_type="memory")
-                    memory_ids_seen.add(rel.source_id)
-
-                if rel.target_id not in memory_ids_seen:
-                    self._graph.add_node(target_node, node_type="memory")
-                    memory_ids_seen.add(rel.target_id)
-
-                # Add edge between memories
-                self._graph.add_edge(
-                    source_node,
-                    target_node,
-                    edge_type="relationship",
-                    relationship=rel.relationship,
-                    description=rel.description,
-                    confidence=rel.confidence,
-                )
+            rel_result = await session.stream(
+                select(
+                    MemoryRelationship.source_id,
+                    MemoryRelationship.target_id,
+                    MemoryRelationship.relationship,
+                    MemoryRelationship.description,
+                    MemoryRelationship.confidence,
+                ).execution_options(yield_per=_LOAD_BATCH_SIZE)
+            )
 
-            logger.debug(f"Loaded {len(relationships)} memory-memory relationships")
+            rel_count = 0
+            async for rows in rel_result.partitions():
+                for row in rows:
+                    self._add_memory_relationship(*row)
+                rel_count += len(rows)
+
+            logger.debug(f"Loaded {rel_count} memory-memory relationships")
 
             # 4. Load entity-entity relationships (Phase 7: personal knowledge graph)
-            ent_rel_result = await session.execute(select(EntityRelModel))
-            entity_rels = ent_rel_result.scalars().all()
-
-            for rel in entity_rels:
-                source_node = f"entity:{rel.source_entity_id}"
-                target_node = f"entity:{rel.target_entity_id}"
-
-                # Only add edge if both entity nodes exist
-                if self._graph.has_node(source_node) and self._graph.has_node(target_node):
-                    self._graph.add_edge(
-                        source_node,
-                        target_node,
-                        edge_type="entity_relationship",
-                        relationship=rel.relationship,
-                        description=rel.description,
-                        confidence=rel.confidence,
-                    )
+            ent_rel_result = await session.stream(
+                select(
+                    EntityRelModel.source_entity_id,
+                    EntityRelModel.target_entity_id,
+                    EntityRelModel.relationship,
+                    EntityRelModel.description,
+                    EntityRelModel.confidence,
+                ).execution_options(yield_per=_LOAD_BATCH_SIZE)
+            )
 
-            logger.debug(f"Loaded {len(entity_rels)} entity-entity relationships")
+            ent_rel_count = 0
+            async for rows in ent_rel_result.partitions():
+                for row in rows:
+                    self._add_entity_relationship(*row)
+                ent_rel_count += len(rows)
+
+            logger.debug(f"Loaded {ent_rel_count} entity-entity relationships")
+
+            # 5. Load aliases so reference resolution is a dict lookup
+            alias_result = await session.execute(
+                select(
+                    EntityAlias.alias, EntityAlias.user_name, EntityAlias.entity_id,
+                ).order_by(EntityAlias.id)
+            )
+            for row in alias_result:
+                self._add_alias(*row)
+
+            logger.debug(f"Loaded {len(self._alias_index)} entity aliases")
 
         logger.info(
             f"KnowledgeGraph loaded: {self.get_node_count()} nodes, "
             f"{self.get_edge_count()} edges"
         )
 
+    # =========================================================================
+    # Node/Edge Mutation (shared by _load_from_db and apply_delta)
+    # =========================================================================
+
+    def _add_entity(
+        self,
+        entity_id: int,
+        entity_type: str,
+        name: str,
+        qualified_name: Optional[str],
+        user_id: Optional[str],
+        mention_count: int,
+        user_name: str,
+    ) -> None:
+        """Add an entity node, or replace the attributes of an existing one."""
+        node_id = f"entity:{entity_id}"
+        if node_id in self._type_lower:
+            # Attribute update: aliases still point at the same entity
+            self._unindex_entity(node_id, entity_id, drop_aliases=False)
+        # Types, user ids and user names repeat across every entity row;
+        # each row brings its own copy unless interned
+        entity_type = _intern(entity_type)
+        user_id = _intern(user_id)
+        user_name = _intern(user_name)
+        self._entity_nodes_by_type.setdefault(entity_type, {})[node_id] = None
+        name_lower = (name or "").lower()
+        self._type_lower[node_id] = sys.intern((entity_type or "").lower())
+        self._name_lower[node_id] = name_lower
+        if name_lower:
+            key = (name_lower, user_name)
+            if self._name_index.setdefault(key, entity_id) == entity_id:
+                self._name_keys[entity_id] = key
+        self._graph.add_node(
+            node_id,
+            node_type="entity",
+            entity_type=entity_type,
+            name=name,
+            qualified_name=qualified_name,
+            user_id=user_id,
+            mention_count=mention_count,
+        )
+
+    def _unindex_entity(
+        self, node_id: str, entity_id: int, drop_aliases: bool = True
+    ) -> None:
+        """Drop an entity node from the secondary indexes."""
+        entity_type = self._graph.nodes[node_id].get("entity_type")
+        nodes = self._entity_nodes_by_type.get(entity_type)
+        if nodes is not None:
+            nodes.pop(node_id, None)
+            if not nodes:
+                del self._entity_nodes_by_type[entity_type]
+        self._type_lower.pop(node_id, None)
+        self._name_lower.pop(node_id, None)
+        # Only the keys this entity won are recorded against it, so other
+        # entities sharing a name or alias keep theirs. _resolve_reference
+        # falls back to the database for keys that lose their entry here.
+        key = self._name_keys.pop(entity_id, None)
+        if key is not None and self._name_index.get(key) == entity_id:
+            del self._name_index[key]
+        if drop_aliases:
+            for key in self._alias_keys.pop(entity_id, ()):
+                if self._alias_index.get(key) == entity_id:
+                    del self._alias_index[key]
+
+    def _add_memory(self, memory_id: int) -> str:
+        """Add a memory node if missing and return its node id."""
+        node_id = f"memory:{memory_id}"
+        if node_id not in self._memory_nodes:
+            self._graph.add_node(node_id, node_type="memory")
+            self._memory_nodes[node_id] = None
+        return node_id
+
+    def _add_reference(
+        self,
+        memory_id: int,
+        entity_id: int,
+        relationship: str,
+    ) -> None:
+        """
+        Add a memory -> entity edge; the memory node is created if missing.
+
+        The ref's context_snippet stays in SQLite: nothing reads it from the
+        graph, and it would otherwise be the bulk of every reference edge.
+        """
+        memory_node_id = self._add_memory(memory_id)
+        entity_node_id = f"entity:{entity_id}"
+        if self._graph.has_node(entity_node_id):
+            self._graph.add_edge(
+                memory_node_id,
+                entity_node_id,
+                edge_type="references",
+                relationship=_intern(relationship),
+            )
+
+    def _add_memory_relationship(
+        self,
+        source_id: int,
+        target_id: int,
+        relationship: str,
+        description: Optional[str],
+        confidence: Optional[float],
+    ) -> None:
+        """Add a memory -> memory edge, creating both memory nodes if missing."""
+        self._graph.add_edge(
+            self._add_memory(source_id),
+            self._add_memory(target_id),
+            edge_type="relationship",
+            relationship=_intern(relationship),
+            description=description,
+            confidence=confidence,
+        )
+
+    def _add_entity_relationship(
+        self,
+        source_id: int,
+        target_id: int,
+        relationship: str,
+        description: Optional[str],
+        confidence: Optional[float],
+    ) -> None:
+        """Add an entity -> entity edge if both entity nodes exist."""
+        source_node = f"entity:{source_id}"
+        target_node = f"entity:{target_id}"
+        if self._graph.has_node(source_node) and self._graph.has_node(target_node):
+            self._graph.add_edge(
+                source_node,
+                target_node,
+                edge_type="entity_relationship",
+                relationship=_intern(relationship),
+                description=description,
+                confidence=confidence,
+            )
+
+    def _add_alias(self, alias: str, user_name: str, entity_id: int) -> None:
+        """Index an alias; the first entity registered for a key wins."""
+        key = (alias.lower(), user_name)
+        if self._alias_index.setdefault(key, entity_id) == entity_id:
+            self._alias_keys.setdefault(entity_id, set()).add(key)
+
+    def _remove_edge(self, source_node: str, target_node: str) -> None:
+        """Remove an edge if present."""
+        if self._graph.has_edge(source_node, target_node):
+            self._graph.remove_edge(source_node, target_node)
+
+    def apply_delta(self, delta: GraphDelta) -> None:
+        """
+        Mirror a batch of database changes into the loaded graph in place.
+
+        A cheaper alternative to reload_from_db() when the caller knows
+        exactly what changed. Removals are applied before additions, so a
+        delta can move an edge or replace a node in one call. Has no effect
+        until the graph has been loaded; the next load reads the database.
+
+        Args:
+            delta: The changes to apply
+        """
+        if not self._loaded:
+            return
+
+        for memory_id, entity_id in delta.removed_refs:
+            self._remove_edge(f"memory:{memory_id}", f"entity:{entity_id}")
+        for source_id, target_id in delta.removed_memory_relationships:
+            self._remove_edge(f"memory:{source_id}", f"memory:{target_id}")
+        for source_id, target_id in delta.removed_entity_relationships:
+            self._remove_edge(f"entity:{source_id}", f"entity:{target_id}")
+
+        for entity_id in delta.removed_entity_ids:
+            node_id = f"entity:{entity_id}"
+            if self._graph.has_node(node_id):
+                self._unindex_entity(node_id, entity_id)
+                self._graph.remove_node(node_id)
+        for memory_id in delta.removed_memory_ids:
+            node_id = f"memory:{memory_id}"
+            if self._graph.has_node(node_id):
+                self._memory_nodes.pop(node_id, None)
+                self._graph.remove_node(node_id)
+
+        for entity in delta.added_entities:
+            self._add_entity(
+                entity["id"],
+                entity["entity_type"],
+                entity["name"],
+                entity.get("qualified_name"),
+                entity.get("user_id"),
+                entity.get("mention_count", 1),
+                entity.get("user_name", "default"),
+            )
+        for ref in delta.added_refs:
+            self._add_reference(
+                ref["memory_id"],
+                ref["entity_id"],
+                ref.get("relationship", "mentions"),
+            )
+        for rel in delta.added_memory_relationships:
+            self._add_memory_relationship(
+                rel["source_id"],
+                rel["target_id"],
+                rel["relationship"],
+                rel.get("description"),
+                rel.get("confidence", 1.0),
+            )
+        for rel in delta.added_entity_relationships:
+            self._add_entity_relationship(
+                rel["source_entity_id"],
+                rel["target_entity_id"],
+                rel["relationship"],
+                rel.get("description"),
+                rel.get("confidence", 1.0),
+            )
+        for alias in delta.added_aliases:
+            self._add_alias(alias["alias"], alias["user_name"], alias["entity_id"])
+        for entity_id, increment in delta.mention_increments.items():
+            attrs = self._graph.nodes.get(f"entity:{entity_id}")
+            if attrs is not None:
+                attrs["mention_count"] = (attrs.get("mention_count") or 0) + increment
+
     def get_node_count(self) -> int:
         """
         Return the total number of nodes in the graph.
@@ -313,12 +617,13 @@ class KnowledgeGraph:
         Returns:
             List of entity node IDs (e.g., ["entity:1", "entity:2"])
         """
-        result = []
-        for node_id, attrs in self._graph.nodes(data=True):
-            if attrs.get("node_type") == "entity":
-                if entity_type is None or attrs.get("entity_type") == entity_type:
-                    result.append(node_id)
-        return result
+        if entity_type is not None:
+            return list(self._entity_nodes_by_type.get(entity_type, ()))
+        return [
+            node_id
+            for nodes in self._entity_nodes_by_type.values()
+            for node_id in nodes
+        ]
 
     def get_memory_nodes(self) -> List[str]:
         """
@@ -327,11 +632,7 @@ class KnowledgeGraph:
         Returns:
             List of memory node IDs (e.g., ["memory:1", "memory:2"])
         """
-        return [
-            node_id
-            for node_id, attrs in self._graph.nodes(data=True)
-            if attrs.get("node_type") == "memory"
-        ]
+        return list(self._memory_nodes)
 
     def get_memories_for_entity(self, entity_id: int) -> List[int]:
         """
@@ -349,14 +650,11 @@ class KnowledgeGraph:
         if not self._graph.has_node(entity_node):
             return []
 
-        memory_ids = []
-        for pred in self._graph.predecessors(entity_node):
-            if pred.startswith("memory:"):
-                try:
-                    memory_ids.append(int(pred.split(":")[1]))
-                except (ValueError, IndexError):
-                    continue
-        return memory_ids
+        return [
+            int(pred[_MEMORY_PREFIX_LEN:])
+            for pred in self._graph.predecessors(entity_node)
+            if pred.startswith(_MEMORY_PREFIX)
+        ]
 
     def get_entities_for_memory(self, memory_id: int) -> List[int]:
         """
@@ -374,14 +672,11 @@ class KnowledgeGraph:
         if not self._graph.has_node(memory_node):
             return []
 
-        entity_ids = []
-        for succ in self._graph.successors(memory_node):
-            if succ.startswith("entity:"):
-                try:
-                    entity_ids.append(int(succ.split(":")[1]))
-                except (ValueError, IndexError):
-                    continue
-        return entity_ids
+        return [
+            int(succ[_ENTITY_PREFIX_LEN:])
+            for succ in self._graph.successors(memory_node)
+            if succ.startswith(_ENTITY_PREFIX)
+        ]
 
     def get_related_memories(
         self, memory_id: int, max_depth: int = 2
@@ -403,22 +698,31 @@ class KnowledgeGraph:
         if not self._graph.has_node(memory_node):
             return []
 
-        # BFS with depth limit
-        # Note: bfs_tree returns a DiGraph of the BFS tree
-        try:
-            bfs_tree = nx.bfs_tree(self._graph, memory_node, depth_limit=max_depth)
-        except nx.NetworkXError:
-            return []
+        return self._bfs_memories([memory_node], max_depth)
+
+    def _bfs_memories(self, seeds: List[str], max_depth: int) -> List[int]:
+        """
+        Collect memory ids reachable from seed nodes within max_depth hops.
 
+        BFS over outgoing edges from every seed at once, sharing one visited
+        set; seeds themselves are not reported. For a single seed this is
+        the same discovery order as nx.bfs_tree without building a tree graph.
+        """
+        succ = self._graph.succ
+        visited = set(seeds)
+        queue = deque((seed, 0) for seed in seeds)
         related_memory_ids = []
-        for node in bfs_tree.nodes():
-            if node == memory_node:
-                continue  # Exclude starting node
-            if node.startswith("memory:"):
-                try:
-                    related_memory_ids.append(int(node.split(":")[1]))
-                except (ValueError, IndexError):
+        while queue:
+            node, depth = queue.popleft()
+            if depth == max_depth:
+                continue
+            for neighbor in succ[node]:
+                if neighbor in visited:
                     continue
+                visited.add(neighbor)
+                if neighbor.startswith(_MEMORY_PREFIX):
+                    related_memory_ids.append(int(neighbor[_MEMORY_PREFIX_LEN:]))
+                queue.append((neighbor, depth + 1))
 
         return related_memory_ids
 
@@ -470,20 +774,19 @@ class KnowledgeGraph:
         # Direct memories are predecessors of the entity
         direct_memory_ids = self.get_memories_for_entity(entity_id)
 
-        # Related memories: explore from direct memories
-        related_memory_ids: Set[int] = set()
+        # Related memories: one BFS seeded with every direct memory, so
+        # overlapping neighborhoods are walked once and direct memories are
+        # never reported as related
+        related_memory_ids: List[int] = []
         if max_hops > 1:
-            for mem_id in direct_memory_ids:
-                related = self.get_related_memories(mem_id, max_depth=max_hops - 1)
-                related_memory_ids.update(related)
-
-        # Remove direct memories from related (no duplicates)
-        related_memory_ids -= set(direct_memory_ids)
+            related_memory_ids = self._bfs_memories(
+                [f"memory:{mem_id}" for mem_id in direct_memory_ids], max_hops - 1
+            )
 
         return {
             "entity": entity_id,
             "direct_memories": direct_memory_ids,
-            "related_memories": list(related_memory_ids),
+            "related_memories": related_memory_ids,
         }
 
     # =========================================================================
@@ -525,8 +828,10 @@ class KnowledgeGraph:
         if current_entity_id is None:
             return {"found": False, "error": f"Unknown reference: '{query_parts[0]}'"}
 
-        current_node = f"entity:{current_entity_id}"
-        attrs = self.get_node_attributes(current_node)
+        # Read attribute dicts in place; the last one read is the terminal
+        # entity's. None if the entity was only found in the database.
+        nodes = self._graph.nodes
+        attrs = nodes.get(f"entity:{current_entity_id}")
         traversal_path.append(
             attrs.get("name", str(current_entity_id)) if attrs else str(current_entity_id)
         )
@@ -541,31 +846,35 @@ class KnowledgeGraph:
                     "partial_path": traversal_path,
                 }
             current_entity_id = connected_id
-            node = f"entity:{current_entity_id}"
-            attrs = self.get_node_attributes(node)
+            attrs = nodes.get(f"entity:{current_entity_id}")
             traversal_path.append(
                 attrs.get("name", str(current_entity_id)) if attrs else str(current_entity_id)
             )
 
         # Step 3: Gather memories for terminal entity
         memory_ids = self.get_memories_for_entity(current_entity_id)
-        terminal_attrs = self.get_node_attributes(f"entity:{current_entity_id}")
+        terminal_attrs = attrs
 
-        # Fetch memory content from DB
+        # Fetch memory content from DB: only the four returned columns, with
+        # the id list bound in chunks so heavily-referenced entities stay
+        # under SQLite's bound-parameter limit
         memories_data = []
         if memory_ids:
             async with self._db.get_session() as session:
-                result = await session.execute(
-                    select(Memory).where(Memory.id.in_(memory_ids))
-                )
-                memories = result.scalars().all()
-                for m in memories:
-                    memories_data.append({
-                        "id": m.id,
-                        "content": m.content,
-                        "categories": m.categories,
-                        "created_at": m.created_at.isoformat() if m.created_at else None,
-                    })
+                for start in range(0, len(memory_ids), _MEMORY_FETCH_CHUNK_SIZE):
+                    chunk = memory_ids[start:start + _MEMORY_FETCH_CHUNK_SIZE]
+                    result = await session.execute(
+                        select(
+                            Memory.id, Memory.content, Memory.categories, Memory.created_at,
+                        ).where(Memory.id.in_(chunk))
+                    )
+                    for memory_id, content, categories, created_at in result:
+                        memories_data.append({
+                            "id": memory_id,
+                            "content": content,
+                            "categories": categories,
+                            "created_at": created_at.isoformat() if created_at else None,
+                        })
 
         return {
             "found": True,
@@ -585,6 +894,15 @@ class KnowledgeGraph:
 
         ref_lower = reference.lower().strip()
 
+        # Indexes built at load time answer the common case without a query
+        key = (ref_lower, user_name)
+        entity_id = self._alias_index.get(key)
+        if entity_id is None:
+            entity_id = self._name_index.get(key)
+        if entity_id is not None:
+            return entity_id
+
+        # Fall back to the database for aliases/entities added since load
         async with self._db.get_session() as session:
             # Try alias lookup first
             alias_result = await session.execute(
@@ -621,27 +939,26 @@ class KnowledgeGraph:
         # Check all neighbors (both directions for entity-entity edges)
         neighbors = set()
         for succ in self._graph.successors(entity_node):
-            if succ.startswith("entity:"):
+            if succ.startswith(_ENTITY_PREFIX):
                 neighbors.add(succ)
         for pred in self._graph.predecessors(entity_node):
-            if pred.startswith("entity:"):
+            if pred.startswith(_ENTITY_PREFIX):
                 neighbors.add(pred)
 
+        # Types that match: the term itself, plus "pet" for pet words. Decided
+        # once here rather than per neighbor.
+        if search_lower in _PET_WORDS:
+            target_types = frozenset((search_lower, "pet"))
+        else:
+            target_types = frozenset((search_lower,))
+
         for neighbor in neighbors:
-            attrs = self._graph.nodes.get(neighbor, {})
-            entity_type = (attrs.get("entity_type") or "").lower()
-            entity_name = (attrs.get("name") or "").lower()
-
-            # Match by pet words -> pet type
-            pet_words = {"dog", "cat", "pet", "bird", "fish", "hamster", "rabbit", "parrot", "turtle", "horse"}
-            if search_lower in pet_words and entity_type == "pet":
-                return int(neighbor.split(":")[1])
-            # Direct type match
-            if search_lower == entity_type:
-                return int(neighbor.split(":")[1])
-            # Name match (exact or substring)
-            if search_lower == entity_name or search_lower in entity_name:
-                return int(neighbor.split(":")[1])
+            # Type match, else name match (exact or substring)
+            if (
+                self._type_lower.get(neighbor, "") in target_types
+                or search_lower in self._name_lower.get(neighbor, "")
+            ):
+                return int(neighbor[_ENTITY_PREFIX_LEN:])
 
         return None
 
@@ -31,20 +31,20 @@ except ImportError:
     from daem0nmcp.config import settings
     from daem0nmcp.logging_config import StructuredFormatter
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-# Configure structured logging (optional - only if env var set)
+# Configure logging: a single root handler whose formatter is chosen by
+# DAEM0NMCP_STRUCTURED_LOGS. basicConfig is a no-op if the host process has
+# already configured logging.
 if os.getenv('DAEM0NMCP_STRUCTURED_LOGS'):
     handler = logging.StreamHandler()
     handler.setFormatter(StructuredFormatter())
-    daem0n_logger = logging.getLogger('daem0nmcp')
-    daem0n_logger.addHandler(handler)
-    daem0n_logger.setLevel(logging.INFO)
+    logging.basicConfig(level=getattr(logging, settings.log_level), handlers=[handler])
+    logging.getLogger('daem0nmcp').setLevel(logging.INFO)
+else:
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+logger = logging.getLogger(__name__)
 
 # Server instructions for Claude - sent automatically during MCP initialization.
 # This is the primary mechanism for teaching Claude how to use DaemonChat tools.
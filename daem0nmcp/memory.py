@@ -11,6 +11,7 @@ This module handles:
 """
 
 import logging
+import math
 import os
 import re
 import sys
@@ -28,14 +29,14 @@ from .config import settings
 from .similarity import (
     TFIDFIndex,
     extract_keywords,
-    calculate_memory_decay,
+    calculate_memory_decay_batch,
     detect_conflict,
 )
 from .cache import get_recall_cache, make_cache_key
 from . import vectors
 from .graph import KnowledgeGraph
 from .recall_planner import RecallPlanner
-from .auto_detect import CATEGORY_HALF_LIVES, AUTO_DECAY_MULTIPLIER
+from .auto_detect import AUTO_DECAY_MULTIPLIER, CATEGORY_DECAY_K, CATEGORY_DECAY_K_AUTO
 from .temporal import _humanize_timedelta
 from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
@@ -253,8 +254,9 @@ class MemoryManager:
         """
         Invalidate the knowledge graph cache.
 
-        Call this after remember() or any operation that modifies
-        entities, memories, or relationships in the database.
+        Call this after any operation that modifies entities, memories,
+        or relationships in the database without mirroring the change
+        into the graph (remember() applies a GraphDelta instead).
         Forces next get_knowledge_graph() to reload from SQLite.
         """
         if self._knowledge_graph is not None:
@@ -573,23 +575,25 @@ class MemoryManager:
         # Clear recall cache since memories changed
         get_recall_cache().clear()
 
-        # Invalidate knowledge graph cache (new memory added)
-        self.invalidate_graph_cache()
-
-        # Auto-extract entities if user_id provided
+        # Auto-extract entities if user_id provided. A memory only enters the
+        # knowledge graph through its entity refs, so the extraction's delta
+        # is the whole graph change and a loaded graph is patched in place.
         if user_id:
             try:
                 from .entity_manager import EntityManager
                 ent_manager = EntityManager(self.db)
-                await ent_manager.process_memory(
+                extraction = await ent_manager.process_memory(
                     memory_id=memory_id,
                     content=content,
                     user_id=user_id,
                     rationale=rationale,
                     user_name=effective_user_name,
                 )
+                if self._knowledge_graph is not None:
+                    self._knowledge_graph.apply_delta(extraction["graph_delta"])
             except Exception as e:
                 logger.debug(f"Entity extraction failed (non-fatal): {e}")
+                self.invalidate_graph_cache()
 
         # Track goals in session state for follow-up (like old 'decision' tracking)
         if 'goal' in categories and user_id:
@@ -1208,8 +1212,11 @@ class MemoryManager:
             valid_memory_ids = await check_temporal_validity(list(memories.keys()))
             memories = {mid: mem for mid, mem in memories.items() if mid in valid_memory_ids}
 
-        # Score with decay and organize
-        scored_memories = []
+        # Score with decay and organize. The first pass filters and resolves
+        # each memory's decay constant; decay itself is computed in one
+        # vectorized call.
+        candidates = []
+        default_decay_k = math.log(2) / decay_half_life_days
         for mem_id, base_score in (search_results or []):
             mem = memories.get(mem_id)
             if not mem:
@@ -1229,19 +1236,10 @@ class MemoryManager:
                 if not (set(mem_categories) & cats):
                     continue
 
-            # Calculate final score with decay
-            # Permanent memories don't decay
+            # Permanent memories don't decay (decay constant 0.0)
             if getattr(mem, 'is_permanent', False) or (set(mem_categories) & PERMANENT_CATEGORIES):
-                decay = 1.0  # No decay for permanent memories
+                decay_k = 0.0
             else:
-                # Per-category decay: use the slowest (most generous) rate among categories
-                half_lives = [
-                    CATEGORY_HALF_LIVES[cat]
-                    for cat in mem_categories
-                    if cat in CATEGORY_HALF_LIVES
-                ]
-                effective_half_life = max(half_lives) if half_lives else decay_half_life_days
-
                 # Auto-detected memories decay faster than explicit ones
                 mem_tags = getattr(mem, 'tags', None) or []
                 if isinstance(mem_tags, str):
@@ -1250,11 +1248,28 @@ class MemoryManager:
                         mem_tags = json.loads(mem_tags)
                     except (json.JSONDecodeError, TypeError):
                         mem_tags = []
-                if "auto" in mem_tags and "explicit" not in mem_tags:
-                    effective_half_life *= AUTO_DECAY_MULTIPLIER
+                is_auto = "auto" in mem_tags and "explicit" not in mem_tags
+                decay_ks = CATEGORY_DECAY_K_AUTO if is_auto else CATEGORY_DECAY_K
 
-                decay = calculate_memory_decay(mem.created_at, effective_half_life)
+                # Per-category decay: use the slowest (most generous) rate among categories
+                category_ks = [decay_ks[cat] for cat in mem_categories if cat in decay_ks]
+                if category_ks:
+                    decay_k = min(category_ks)
+                elif is_auto:
+                    decay_k = default_decay_k / AUTO_DECAY_MULTIPLIER
+                else:
+                    decay_k = default_decay_k
+
+            candidates.append((mem, base_score, mem_categories, decay_k))
+
+        decays = calculate_memory_decay_batch(
+            [mem.created_at for mem, _, _, _ in candidates],
+            [decay_k for _, _, _, decay_k in candidates],
+        )
 
+        scored_memories = []
+        for (mem, base_score, mem_categories, _), decay in zip(candidates, decays.tolist()):
+            # Calculate final score with decay
             final_score = base_score * decay
 
             # Boost failed outcomes - they're valuable warnings
@@ -1278,6 +1293,7 @@ class MemoryManager:
 
         # Build flat list of memories (new format)
         results_list = []
+        now = datetime.now(timezone.utc)
         for mem, final_score, base_score, decay in paginated_memories:
             # Get memory categories (from new JSON field or deprecated single field)
             mem_categories = getattr(mem, 'categories', None) or []
@@ -1299,7 +1315,7 @@ class MemoryManager:
                     'is_permanent': mem.is_permanent,
                     'pinned': mem.pinned,
                     'created_at': mem.created_at.isoformat(),
-                    'time_ago': _humanize_timedelta(mem.created_at),
+                    'time_ago': _humanize_timedelta(mem.created_at, now),
                 }
             else:
                 mem_dict = {
@@ -1317,7 +1333,7 @@ class MemoryManager:
                     'is_permanent': mem.is_permanent,
                     'pinned': mem.pinned,
                     'created_at': mem.created_at.isoformat(),
-                    'time_ago': _humanize_timedelta(mem.created_at),
+                    'time_ago': _humanize_timedelta(mem.created_at, now),
                 }
 
             # Add warning annotation for failed outcomes
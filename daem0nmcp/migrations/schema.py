@@ -339,6 +339,40 @@ MIGRATIONS: List[Tuple[int, str, List[str]]] = [
         "CREATE INDEX IF NOT EXISTS idx_entity_relationships_type ON entity_relationships(relationship);",
         "CREATE INDEX IF NOT EXISTS idx_entity_relationships_user ON entity_relationships(user_name);",
     ]),
+    (20, "Add lower() expression indexes for case-insensitive entity resolution", [
+        # EntityResolver matches on lower(name) / lower(alias); without these
+        # every cache miss is a full table scan.
+        "CREATE INDEX IF NOT EXISTS idx_extracted_entities_lower_name ON extracted_entities(user_id, entity_type, lower(name));",
+        "CREATE INDEX IF NOT EXISTS idx_entity_aliases_lower_alias ON entity_aliases(lower(alias), user_name);",
+    ]),
+    (21, "Add unique indexes on memory_entity_refs and entity_aliases", [
+        # Drop duplicates left by the old check-then-insert path, keeping the oldest row
+        """
+        DELETE FROM memory_entity_refs WHERE id NOT IN (
+            SELECT MIN(id) FROM memory_entity_refs GROUP BY memory_id, entity_id
+        );
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_memory_entity_refs_memory_entity ON memory_entity_refs(memory_id, entity_id);",
+        """
+        DELETE FROM entity_aliases WHERE id NOT IN (
+            SELECT MIN(id) FROM entity_aliases GROUP BY entity_id, alias, user_name
+        );
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_entity_aliases_entity_alias_user ON entity_aliases(entity_id, alias, user_name);",
+    ]),
+    (22, "Add is_style_profile flag with a partial unique index on memories", [
+        "ALTER TABLE memories ADD COLUMN is_style_profile BOOLEAN DEFAULT 0;",
+        # Flag the row the old tags LIKE lookup returned (lowest id per user);
+        # any duplicates stay as ordinary memories
+        """
+        UPDATE memories SET is_style_profile = 1 WHERE id IN (
+            SELECT MIN(id) FROM memories
+            WHERE tags LIKE '%"profile"%' AND tags LIKE '%"style"%'
+            GROUP BY user_name
+        );
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_memories_style_profile ON memories(user_name) WHERE is_style_profile = 1;",
+    ]),
 ]
 
 
@@ -7,7 +7,7 @@ Tables:
 - memory_relationships: Graph edges between memories for causal reasoning
 """
 
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, LargeBinary, Float, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Boolean, LargeBinary, Float, ForeignKey, Index, func, text
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import relationship as orm_relationship
 from datetime import datetime, timezone
@@ -157,11 +157,20 @@ class Memory(Base):
     source_client = Column(String, nullable=True)   # e.g., "opencode", "claude-code"
     source_model = Column(String, nullable=True)     # e.g., "anthropic/claude-sonnet-4", "openai/gpt-5"
 
+    # Marks the single per-user style profile memory (tags ["profile", "style"])
+    # so it can be found by index instead of scanning the tags JSON
+    is_style_profile = Column(Boolean, default=False)
+
     # Timestamps
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
                        onupdate=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        Index('uq_memories_style_profile', 'user_name', unique=True,
+              sqlite_where=text('is_style_profile = 1')),
+    )
+
 
 class Fact(Base):
     """
@@ -535,6 +544,11 @@ class ExtractedEntity(Base):
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
                        onupdate=lambda: datetime.now(timezone.utc))
 
+    # Expression index for EntityResolver's case-insensitive name match
+    __table_args__ = (
+        Index('idx_extracted_entities_lower_name', 'user_id', 'entity_type', func.lower(name)),
+    )
+
 
 class MemoryEntityRef(Base):
     """
@@ -556,6 +570,12 @@ class MemoryEntityRef(Base):
     context_snippet = Column(Text, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # One ref per memory/entity pair; lets process_memory insert with
+    # ON CONFLICT DO NOTHING instead of checking for existing refs first
+    __table_args__ = (
+        Index('uq_memory_entity_refs_memory_entity', 'memory_id', 'entity_id', unique=True),
+    )
+
     # ORM relationships
     memory = orm_relationship("Memory", backref="entity_refs")
     entity = orm_relationship("ExtractedEntity", backref="memory_refs")
@@ -577,6 +597,13 @@ class EntityAlias(Base):
     user_name = Column(String, nullable=False, default="default", index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # Expression index for EntityResolver's case-insensitive alias match;
+    # unique index lets aliases be inserted with ON CONFLICT DO NOTHING
+    __table_args__ = (
+        Index('idx_entity_aliases_lower_alias', func.lower(alias), 'user_name'),
+        Index('uq_entity_aliases_entity_alias_user', 'entity_id', 'alias', 'user_name', unique=True),
+    )
+
     entity = orm_relationship("ExtractedEntity", backref="aliases")
 
 
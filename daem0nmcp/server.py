@@ -1,5 +1,6 @@
 # ruff: noqa: E402
 """Daem0nMCP Server -- Composition root, lifecycle, and entry point."""
+import asyncio
 import atexit
 import logging
 
@@ -93,7 +94,6 @@ except ImportError:
     from daem0nmcp.dreaming.persistence import persist_session_summary
 
 if settings.dream_enabled:
-    import uuid as _uuid
     from datetime import datetime as _dt, timezone as _tz
 
     _dream_scheduler = IdleDreamScheduler(
@@ -104,6 +104,21 @@ if settings.dream_enabled:
     if _FASTMCP_MIDDLEWARE_AVAILABLE:
         _covenant_middleware.set_dream_scheduler(_dream_scheduler)
 
+    # Strategies hold only configuration, so one pipeline serves every session
+    _dream_pipeline: tuple[DreamStrategy, ...] = (
+        FailedDecisionReview(),
+        PendingOutcomeResolver(),
+        ConnectionDiscovery(
+            lookback_hours=settings.dream_connection_lookback_hours,
+            max_connections=settings.dream_connection_max_per_session,
+            min_shared_entities=settings.dream_connection_min_shared_entities,
+            confidence=settings.dream_connection_confidence,
+        ),
+        CommunityRefresh(
+            staleness_threshold=settings.dream_community_staleness_threshold,
+        ),
+    )
+
     async def _dream_callback(scheduler: IdleDreamScheduler):
         """Execute a dream session using the most recently accessed user context."""
         _dream_logger = logging.getLogger("daem0nmcp.dreaming")
@@ -112,46 +127,29 @@ if settings.dream_enabled:
             _dream_logger.debug("No user contexts available for dreaming")
             return
 
-        most_recent_id = max(
-            _cm._user_contexts.keys(),
-            key=lambda p: _cm._user_contexts[p].last_accessed,
-        )
-        ctx = _cm._user_contexts[most_recent_id]
+        # Contexts are kept in access order; the last one is the most recent
+        ctx = _cm._user_contexts[next(reversed(_cm._user_contexts))]
 
         if not ctx.initialized:
             return
 
-        session = DreamSession(
-            session_id=str(_uuid.uuid4())[:12],
-            user_id=ctx.user_id,
-            started_at=_dt.now(_tz.utc),
-        )
+        # session_id and started_at come from the DreamSession defaults
+        session = DreamSession(user_id=ctx.user_id)
 
         try:
-            strategies: list[DreamStrategy] = [
-                FailedDecisionReview(),
-                PendingOutcomeResolver(),
-                ConnectionDiscovery(
-                    lookback_hours=settings.dream_connection_lookback_hours,
-                    max_connections=settings.dream_connection_max_per_session,
-                    min_shared_entities=settings.dream_connection_min_shared_entities,
-                    confidence=settings.dream_connection_confidence,
-                ),
-                CommunityRefresh(
-                    staleness_threshold=settings.dream_community_staleness_threshold,
-                ),
-            ]
-            for strategy in strategies:
-                if scheduler.user_active.is_set():
-                    session.interrupted = True
-                    break
-                session = await strategy.execute(session, ctx, scheduler)
-                if session.interrupted:
-                    break
-
-            session.ended_at = _dt.now(_tz.utc)
-            user_name = getattr(ctx, "current_user", "default") or "default"
-            await persist_session_summary(ctx.memory_manager, session, user_name=user_name)
+            # Pin the context so eviction cannot close its database mid-dream
+            async with hold_context(ctx):
+                for strategy in _dream_pipeline:
+                    if scheduler.user_active.is_set():
+                        session.interrupted = True
+                        break
+                    session = await strategy.execute(session, ctx, scheduler)
+                    if session.interrupted:
+                        break
+
+                session.ended_at = _dt.now(_tz.utc)
+                user_name = ctx.current_user or "default"
+                await persist_session_summary(ctx.memory_manager, session, user_name=user_name)
         except Exception as e:
             _dream_logger.error("Dream session failed: %s", e, exc_info=True)
 
@@ -160,27 +158,28 @@ if settings.dream_enabled:
 
 # --- Cleanup & lifecycle ---
 async def _cleanup_all_contexts():
-    for ctx in _cm._user_contexts.values():
-        try:
-            await ctx.db_manager.close()
-        except Exception:
-            pass
+    # Close every still-open database concurrently; errors are ignored
+    await asyncio.gather(
+        *(
+            ctx.db_manager.close()
+            for ctx in list(_cm._user_contexts.values())
+            if ctx.db_manager._engine is not None
+        ),
+        return_exceptions=True,
+    )
 
 def cleanup():
-    import asyncio
     try:
-        if _dream_scheduler and _dream_scheduler.is_running:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(_dream_scheduler.stop())
-            except RuntimeError:
-                pass
         try:
             loop = asyncio.get_running_loop()
-            loop.create_task(_cleanup_all_contexts())
         except RuntimeError:
-            if any(c.db_manager._engine is not None for c in _cm._user_contexts.values()):
-                asyncio.run(_cleanup_all_contexts())
+            loop = None
+        if loop is not None:
+            if _dream_scheduler and _dream_scheduler.is_running:
+                loop.create_task(_dream_scheduler.stop())
+            loop.create_task(_cleanup_all_contexts())
+        elif any(c.db_manager._engine is not None for c in _cm._user_contexts.values()):
+            asyncio.run(_cleanup_all_contexts())
     except Exception:
         pass
 
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from collections import Counter
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -386,7 +388,8 @@ class TFIDFIndex:
 def calculate_memory_decay(
     created_at: datetime,
     half_life_days: float = DEFAULT_DECAY_HALF_LIFE_DAYS,
-    min_weight: float = MIN_DECAY_WEIGHT
+    min_weight: float = MIN_DECAY_WEIGHT,
+    decay_constant: Optional[float] = None,
 ) -> float:
     """
     Calculate time-based decay for memory relevance.
@@ -398,6 +401,7 @@ def calculate_memory_decay(
         created_at: When the memory was created
         half_life_days: Days until weight is halved (default: 30)
         min_weight: Minimum weight floor (default: 0.3)
+        decay_constant: Precomputed ln(2) / half-life; overrides half_life_days
 
     Returns:
         Weight multiplier between min_weight and 1.0
@@ -414,13 +418,52 @@ def calculate_memory_decay(
         return 1.0
 
     # Exponential decay
-    decay_constant = math.log(2) / half_life_days
+    if decay_constant is None:
+        decay_constant = math.log(2) / half_life_days
     weight = math.exp(-decay_constant * age_days)
 
     # Apply minimum floor
     return max(weight, min_weight)
 
 
+def calculate_memory_decay_batch(
+    created_ats: List[datetime],
+    decay_constants: List[float],
+    min_weight: float = MIN_DECAY_WEIGHT
+) -> np.ndarray:
+    """
+    Vectorized calculate_memory_decay for many memories at once.
+
+    Ages are measured against a single "now" and the exponential is evaluated
+    in one NumPy call. A decay constant of 0.0 means "never decays" and yields
+    a weight of exactly 1.0.
+
+    Args:
+        created_ats: When each memory was created
+        decay_constants: Per-memory ln(2) / half-life
+        min_weight: Minimum weight floor for decaying memories (default: 0.3)
+
+    Returns:
+        Array of weight multipliers, aligned with the inputs
+    """
+    now = datetime.now(timezone.utc)
+    ages = np.fromiter(
+        (
+            (now - (c if c.tzinfo is not None else c.replace(tzinfo=timezone.utc))).total_seconds() / 86400
+            for c in created_ats
+        ),
+        dtype=np.float64,
+        count=len(created_ats),
+    )
+    ks = np.asarray(decay_constants, dtype=np.float64)
+
+    weights = np.exp(-ks * np.maximum(ages, 0.0))
+    # Floor only applies to memories that actually decayed
+    decaying = (ks > 0.0) & (ages > 0.0)
+    weights[decaying] = np.maximum(weights[decaying], min_weight)
+    return weights
+
+
 def detect_conflict(
     new_content: str,
     existing_memories: List[Dict],
@@ -18,19 +18,21 @@ from datetime import datetime, timezone
 from typing import Dict, Optional
 
 try:
-    from .config import Settings
+    from .config import settings
     from .emotion_detect import CAPS_PATTERN, COMMON_ACRONYMS
     from .models import Memory
 except ImportError:
-    from daem0nmcp.config import Settings
+    from daem0nmcp.config import settings
     from daem0nmcp.emotion_detect import CAPS_PATTERN, COMMON_ACRONYMS
     from daem0nmcp.models import Memory
 
 
 # --- Constants ---
 
+# Every alternative is letters + apostrophe + letters; the lookahead rejects
+# most positions before the alternation is tried.
 CONTRACTIONS = re.compile(
-    r"\b(i'm|i'll|i've|i'd|don't|doesn't|didn't|can't|couldn't|won't|wouldn't|"
+    r"\b(?=[a-z]+')(i'm|i'll|i've|i'd|don't|doesn't|didn't|can't|couldn't|won't|wouldn't|"
     r"shouldn't|isn't|aren't|wasn't|weren't|hasn't|haven't|hadn't|"
     r"we're|we've|we'll|we'd|they're|they've|they'll|they'd|"
     r"you're|you've|you'll|you'd|he's|she's|it's|that's|"
@@ -38,6 +40,10 @@ CONTRACTIONS = re.compile(
     re.IGNORECASE
 )
 
+# Sentence break; the lookahead captures the first character of the next
+# sentence without consuming it.
+_SENTENCE_BREAK = re.compile(r'[.!?]+\s+(?=(.))')
+
 CASUAL_ABBREVIATIONS = frozenset({
     "lol", "lmao", "btw", "tbh", "ngl", "imo", "imho",
     "idk", "idc", "smh", "brb", "omg", "wtf", "wth",
@@ -52,10 +58,18 @@ EXPRESSIVE_INTERJECTIONS = frozenset({
 })
 
 
+# The only ASCII characters in the So/Sk categories; everything else that
+# can count as emoji is non-ASCII, so only those characters need a category lookup.
+_ASCII_SYMBOLS = ('^', '`')
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
 def _count_emoji(text: str) -> int:
     """Count emoji characters using unicode category."""
-    count = 0
-    for char in text:
+    count = sum(text.count(sym) for sym in _ASCII_SYMBOLS)
+    if text.isascii():
+        return count
+    for char in _NON_ASCII.findall(text):
         if unicodedata.category(char) in ('So', 'Sk') or (
             '\U0001F600' <= char <= '\U0001FAD6'
         ):
@@ -65,7 +79,7 @@ def _count_emoji(text: str) -> int:
 
 # --- StyleProfile dataclass ---
 
-@dataclass
+@dataclass(slots=True)
 class StyleProfile:
     """Quantified user communication style with EMA-based updates."""
 
@@ -77,7 +91,6 @@ class StyleProfile:
 
     def update(self, new_scores: Dict[str, float]) -> None:
         """Apply EMA update from a new message analysis."""
-        settings = Settings()
         alpha = settings.style_ema_alpha
         self.message_count += 1
         for dim in ['formality', 'verbosity', 'emoji_usage', 'expressiveness']:
@@ -114,18 +127,20 @@ def analyze_style(text: str) -> Dict[str, float]:
 
     Returns empty dict for empty/whitespace-only text.
     """
-    if not text or not text.strip():
+    stripped = text.strip() if text else ''
+    if not stripped:
         return {}
 
-    words = text.split()
+    # Lowercase once in C rather than per word; split() yields the same tokens
+    words = text.lower().split()
     word_count = len(words)
-    lower_words = {w.lower().strip('.,!?;:') for w in words}
+    lower_words = {w.strip('.,!?;:') for w in words}
 
     # --- Formality (0=casual, 1=formal) ---
     formality_signals = []
 
-    # Contractions pull toward casual
-    contraction_count = len(CONTRACTIONS.findall(text))
+    # Contractions pull toward casual (all of them contain an apostrophe)
+    contraction_count = len(CONTRACTIONS.findall(text)) if "'" in text else 0
     formality_signals.append(1.0 - min(contraction_count / max(word_count / 10, 1), 1.0))
 
     # Casual abbreviations pull toward casual
@@ -133,12 +148,12 @@ def analyze_style(text: str) -> Dict[str, float]:
     formality_signals.append(1.0 - min(abbrev_count / 3, 1.0))
 
     # Sentence starts with lowercase -> casual
-    sentences = re.split(r'[.!?]+\s+', text.strip())
-    lowercase_starts = sum(1 for s in sentences if s and s[0].islower())
-    formality_signals.append(1.0 - (lowercase_starts / max(len(sentences), 1)))
+    sentence_starts = _SENTENCE_BREAK.findall(stripped)
+    lowercase_starts = sum(map(str.islower, sentence_starts)) + stripped[0].islower()
+    formality_signals.append(1.0 - (lowercase_starts / (len(sentence_starts) + 1)))
 
     # Missing final punctuation -> casual
-    has_final_punct = text.strip()[-1] in '.!?' if text.strip() else True
+    has_final_punct = stripped[-1] in '.!?'
     formality_signals.append(1.0 if has_final_punct else 0.3)
 
     formality = sum(formality_signals) / len(formality_signals)
@@ -171,8 +186,8 @@ def analyze_style(text: str) -> Dict[str, float]:
     exclaim_count = text.count('!')
     expr_signals.append(min(exclaim_count / 3, 1.0))
 
-    # ALL CAPS words (non-acronym, 3+ chars)
-    caps_matches = CAPS_PATTERN.findall(text)
+    # ALL CAPS words (non-acronym, 3+ chars); all-lowercase text has none
+    caps_matches = [] if text.islower() else CAPS_PATTERN.findall(text)
     meaningful_caps = [w for w in caps_matches if w not in COMMON_ACRONYMS]
     expr_signals.append(min(len(meaningful_caps) / 2, 1.0))
 
@@ -198,7 +213,6 @@ def build_style_guidance(profile: StyleProfile) -> Optional[str]:
     Returns None if not enough messages analyzed yet or if all dimensions
     are in the neutral range.
     """
-    settings = Settings()
     if profile.message_count < settings.style_min_messages_for_guidance:
         return None
 
@@ -265,59 +279,55 @@ def build_style_guidance(profile: StyleProfile) -> Optional[str]:
 
 # --- Style profile persistence ---
 
+async def _select_style_memory(session, user_name: str) -> Optional[Memory]:
+    """Fetch the user's style memory within an open session."""
+    from sqlalchemy import select
+
+    result = await session.execute(
+        select(Memory).where(
+            Memory.user_name == user_name,
+            Memory.is_style_profile == True,  # noqa: E712
+        ).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def _parse_style_profile(mem: Memory) -> Optional[StyleProfile]:
+    """Deserialize a style memory's content, or None if it is unreadable."""
+    try:
+        data = json.loads(mem.content)
+        return StyleProfile.from_dict(data)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
 async def load_style_profile(ctx, user_name: str) -> Optional[StyleProfile]:
     """Load the user's style profile from the style memory.
 
     Returns None if no style profile exists yet.
     """
-    from sqlalchemy import select
-
     async with ctx.db_manager.get_session() as session:
-        result = await session.execute(
-            select(Memory).where(
-                Memory.user_name == user_name,
-                Memory.tags.contains('"profile"'),
-                Memory.tags.contains('"style"'),
-            ).limit(1)
-        )
-        mem = result.scalar_one_or_none()
-
+        mem = await _select_style_memory(session, user_name)
         if mem is None:
             return None
-
-        try:
-            data = json.loads(mem.content)
-            return StyleProfile.from_dict(data)
-        except (json.JSONDecodeError, TypeError):
-            return None
+        return _parse_style_profile(mem)
 
 
 async def update_user_style_profile(ctx, user_name: str, new_scores: dict) -> None:
     """Update the user's style profile with new message scores using EMA.
 
-    Loads existing profile (or creates new), applies EMA update,
-    then upserts the single style memory per user.
+    Reads the existing profile (or starts a new one), applies the EMA update
+    and upserts the single style memory per user, all in one session.
     """
-    from sqlalchemy import select
-
-    # Load existing profile
-    profile = await load_style_profile(ctx, user_name)
-    if profile is None:
-        profile = StyleProfile()
+    async with ctx.db_manager.get_session() as session:
+        mem = await _select_style_memory(session, user_name)
 
-    # Apply EMA update
-    profile.update(new_scores)
+        profile = _parse_style_profile(mem) if mem is not None else None
+        if profile is None:
+            profile = StyleProfile()
 
-    # Upsert: find existing style memory or create new
-    async with ctx.db_manager.get_session() as session:
-        existing = await session.execute(
-            select(Memory).where(
-                Memory.user_name == user_name,
-                Memory.tags.contains('"profile"'),
-                Memory.tags.contains('"style"'),
-            ).limit(1)
-        )
-        mem = existing.scalar_one_or_none()
+        # Apply EMA update
+        profile.update(new_scores)
 
         content = json.dumps(profile.to_dict())
 
@@ -331,6 +341,7 @@ async def update_user_style_profile(ctx, user_name: str, new_scores: dict) -> No
                 tags=["profile", "style"],
                 user_name=user_name,
                 is_permanent=True,
+                is_style_profile=True,
             )
             session.add(new_mem)
 
@@ -1,15 +1,19 @@
 """Temporal utilities for human-readable time formatting."""
 
 from datetime import datetime, timezone
+from typing import Optional
 
 
-def _humanize_timedelta(dt: datetime) -> str:
+def _humanize_timedelta(dt: datetime, now: Optional[datetime] = None) -> str:
     """Convert a datetime to a human-readable relative time string.
 
     Examples: "today", "yesterday", "3 days ago", "2 weeks ago",
               "about a month ago", "3 months ago", "over a year ago"
+
+    Callers formatting many datetimes can pass a single ``now`` (UTC).
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
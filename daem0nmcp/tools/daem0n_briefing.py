@@ -33,9 +33,10 @@ from sqlalchemy import select, func, or_, distinct
 logger = logging.getLogger(__name__)
 
 
-def _days_ago(dt: datetime) -> int:
+def _days_ago(dt: datetime, now: Optional[datetime] = None) -> int:
     """Days since datetime."""
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return max(0, (now - dt).days)
@@ -114,6 +115,7 @@ async def _get_unresolved_threads(
     - Importance multiplier: is_permanent=1.2x
     """
     threads = []
+    now = datetime.now(timezone.utc)
 
     async with ctx.db_manager.get_session() as session:
         result = await session.execute(
@@ -131,7 +133,7 @@ async def _get_unresolved_threads(
             if not matching:
                 continue
 
-            days = _days_ago(mem.created_at)
+            days = _days_ago(mem.created_at, now)
 
             # Exclude stale threads (>90 days)
             if days > 90:
@@ -159,7 +161,7 @@ async def _get_unresolved_threads(
                 "summary": _summarize(mem.content),
                 "category": primary,
                 "days_ago": days,
-                "time_ago": _humanize_timedelta(mem.created_at),
+                "time_ago": _humanize_timedelta(mem.created_at, now),
                 "priority": round(priority, 2),
                 "follow_up_type": _get_follow_up_type(primary, days),
             })
@@ -704,8 +706,8 @@ async def _build_user_briefing(ctx, user_name: str) -> Dict[str, Any]:
         for mem in result.scalars().all():
             recent_topics.append({
                 "id": mem.id, "summary": _summarize(mem.content),
-                "days_ago": _days_ago(mem.created_at),
-                "time_ago": _humanize_timedelta(mem.created_at),
+                "days_ago": _days_ago(mem.created_at, now),
+                "time_ago": _humanize_timedelta(mem.created_at, now),
             })
             if mem.id not in memory_ids:
                 memory_ids.append(mem.id)
@@ -724,7 +726,7 @@ async def _build_user_briefing(ctx, user_name: str) -> Dict[str, Any]:
         for mem in result.scalars().all():
             if "emotion" in (mem.categories or []):
                 emotional_context = _summarize(mem.content, 100)
-                emotional_time_ago = _humanize_timedelta(mem.created_at)
+                emotional_time_ago = _humanize_timedelta(mem.created_at, now)
                 if mem.id not in memory_ids:
                     memory_ids.append(mem.id)
                 break
@@ -3,10 +3,14 @@
 from daem0nmcp.auto_detect import (
     validate_auto_memory,
     NOISE_PATTERNS,
+    NOISE_RE,
+    _NOISE_PREFIXES,
     MIN_CONTENT_LENGTH,
     MIN_WORD_COUNT,
     CATEGORY_HALF_LIVES,
     AUTO_DECAY_MULTIPLIER,
+    CATEGORY_DECAY_K,
+    CATEGORY_DECAY_K_AUTO,
 )
 
 
@@ -73,6 +77,19 @@ class TestValidateAutoMemory:
         result = validate_auto_memory("extremely delightful person", 0.95)
         assert result == {"valid": False, "reason": "too_few_words"}
 
+    def test_word_count_collapses_mixed_whitespace(self):
+        """Word count should treat runs of tabs/newlines/spaces as one separator."""
+        assert validate_auto_memory("extremely\t\tdelightful  \n person", 0.95) == {
+            "valid": False, "reason": "too_few_words"
+        }
+        assert validate_auto_memory("User\tlikes\nstrong\tcoffee", 0.95) == {
+            "valid": True, "action": "auto_store"
+        }
+
+    def test_low_confidence_checked_before_content(self):
+        """Low confidence rejects before noise or length checks run."""
+        assert validate_auto_memory("hi", 0.10) == {"valid": False, "reason": "low_confidence"}
+
     def test_accepts_minimum_length(self):
         """Content at exactly MIN_CONTENT_LENGTH with enough words should pass quality checks."""
         # 15 chars, 4 words - meets both minimums
@@ -118,6 +135,15 @@ class TestValidateAutoMemory:
         result = validate_auto_memory("User might be interested in gardening or something", 0.69)
         assert result == {"valid": False, "reason": "low_confidence"}
 
+    def test_settings_threshold_overrides(self):
+        """Thresholds from a Settings instance should override the defaults."""
+        from daem0nmcp.config import Settings
+        custom = Settings(auto_detect_confidence_high=0.99, auto_detect_confidence_medium=0.50)
+        content = "User mentioned going to the gym regularly"
+        assert validate_auto_memory(content, 0.96, custom) == {"valid": True, "action": "suggest"}
+        assert validate_auto_memory(content, 0.55, custom) == {"valid": True, "action": "suggest"}
+        assert validate_auto_memory(content, 0.45, custom) == {"valid": False, "reason": "low_confidence"}
+
     # =========================================================================
     # Valid content tests
     # =========================================================================
@@ -162,6 +188,45 @@ class TestNoisePatterns:
         assert result_upper["valid"] is False
         assert result_caps["valid"] is False
 
+    def test_combined_regex_matches_same_as_patterns(self):
+        """NOISE_RE should agree with the individual NOISE_PATTERNS."""
+        samples = [
+            "hi there", "Good Morning everyone", "thanks a lot", "I'm fine",
+            "hmmm not sure", "could you check", "I see what you mean",
+            "User loves hiking", "Sarah is my sister", "history buff here",
+        ]
+        for sample in samples:
+            expected = any(p.match(sample.lower()) for p in NOISE_PATTERNS)
+            assert bool(NOISE_RE.match(sample)) == expected, sample
+
+    def test_prefixes_cover_every_alternative(self):
+        """Every NOISE_PATTERNS alternative must start with a _NOISE_PREFIXES entry.
+
+        One sample per alternative: adding a noise phrase means adding its
+        sample here, and a missing prefix then fails instead of silently
+        bypassing the fast path in validate_auto_memory.
+        """
+        samples = [
+            # Greetings and farewells
+            "hi", "hello", "hey", "good morning", "good afternoon", "good evening",
+            "bye", "goodbye", "see you", "take care",
+            # Thanks and acknowledgments
+            "thank", "thanks", "thank you", "you're welcome", "no problem", "sure thing",
+            # Status responses
+            "I'm good", "I'm fine", "I'm okay", "I'm ok", "I'm alright", "I'm great",
+            "I'm doing well", "I'm not bad",
+            # Filler words
+            "um", "uh", "hmm", "well", "so", "anyway", "actually", "basically",
+            # Claude's own questions
+            "can you", "could you", "would you", "let me", "shall I", "do you want",
+            # Bare acknowledgments
+            "yes", "no", "yeah", "yep", "nope", "nah", "okay", "ok", "sure", "right",
+            "got it", "I see",
+        ]
+        for sample in samples:
+            assert NOISE_RE.match(sample), sample
+            assert sample[:2].lower() in _NOISE_PREFIXES, sample
+
 
 class TestCategoryConstants:
     """Test that category-related constants are properly defined."""
@@ -174,6 +239,16 @@ class TestCategoryConstants:
         assert CATEGORY_HALF_LIVES['concern'] == 30.0
         assert CATEGORY_HALF_LIVES['context'] == 14.0
 
+    def test_category_decay_constants_match_half_lives(self):
+        """Precomputed decay constants should equal ln(2) / half-life."""
+        import math
+        for cat, half_life in CATEGORY_HALF_LIVES.items():
+            assert math.isclose(CATEGORY_DECAY_K[cat], math.log(2) / half_life)
+            assert math.isclose(
+                CATEGORY_DECAY_K_AUTO[cat],
+                math.log(2) / (half_life * AUTO_DECAY_MULTIPLIER),
+            )
+
     def test_auto_decay_multiplier(self):
         """AUTO_DECAY_MULTIPLIER should be 0.7."""
         assert AUTO_DECAY_MULTIPLIER == 0.7
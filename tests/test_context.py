@@ -162,3 +162,33 @@ class TestPathResolution:
                 # Clean up database connections
                 await ctx1.db_manager.close()
                 await ctx2.db_manager.close()
+
+
+class TestUserContextRecency:
+    """Test access-order tracking of user contexts."""
+
+    @pytest.fixture
+    def temp_projects(self):
+        """Create temporary project directories."""
+        dirs = [tempfile.mkdtemp() for _ in range(3)]
+        yield dirs
+        for d in dirs:
+            shutil.rmtree(d, ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_most_recent_context_is_last(self, temp_projects):
+        """Every access moves the context to the end of _user_contexts."""
+        from daem0nmcp.context_manager import (
+            get_user_context, _user_contexts, cleanup_all_contexts,
+        )
+
+        await cleanup_all_contexts()
+        try:
+            contexts = [await get_user_context(user_id) for user_id in temp_projects]
+            assert _user_contexts[next(reversed(_user_contexts))] is contexts[-1]
+
+            await get_user_context(temp_projects[0])
+            assert _user_contexts[next(reversed(_user_contexts))] is contexts[0]
+            assert list(_user_contexts.values()) == [contexts[1], contexts[2], contexts[0]]
+        finally:
+            await cleanup_all_contexts()
@@ -1564,6 +1564,13 @@ class TestSessionExperience:
         assert isinstance(result, str)
         assert "3 days ago" == result
 
+    def test_humanize_timedelta_explicit_now(self):
+        """A caller-supplied now is used instead of the current time."""
+        from daem0nmcp.temporal import _humanize_timedelta
+        now = datetime(2025, 6, 15, tzinfo=timezone.utc)
+        assert _humanize_timedelta(datetime(2025, 6, 14, tzinfo=timezone.utc), now) == "yesterday"
+        assert _humanize_timedelta(datetime(2025, 5, 1, tzinfo=timezone.utc), now) == "about a month ago"
+
     @pytest.mark.asyncio
     async def test_briefing_contains_greeting_guidance(self):
         """Returning user briefing contains greeting_guidance with user's name."""
@@ -2101,6 +2108,12 @@ class TestEmotionDetection:
         assert r["source"] == "emphasis"
         assert r["confidence"] == 0.70
 
+    def test_caps_pattern_matches_whole_caps_words_only(self):
+        """CAPS_PATTERN only matches standalone runs of 3+ capitals."""
+        from daem0nmcp.emotion_detect import CAPS_PATTERN
+        text = "WOW it's HUGE. NASA's ABc xABC ABC1 A_BCD \u00c9TAT NO (YES)"
+        assert CAPS_PATTERN.findall(text) == ["WOW", "HUGE", "NASA", "YES"]
+
     def test_detect_emphasis_exclaim_only(self):
         """'This is amazing!!!' -> emphasis from triple exclamation."""
         from daem0nmcp.emotion_detect import detect_emotion
@@ -2126,6 +2139,14 @@ class TestEmotionDetection:
         assert r["source"] == "topic"
         assert r["valence"] == "positive"
 
+    def test_detect_topic_multi_word_phrase(self):
+        """'Got laid off yesterday' -> multi-word heavy topic is matched."""
+        from daem0nmcp.emotion_detect import detect_emotion
+        r = detect_emotion("Got laid off yesterday")
+        assert r is not None
+        assert r["source"] == "topic"
+        assert r["emotion_label"] == "distressed"
+
     def test_acronym_not_flagged(self):
         """'Working with the API and SQL database' -> None (acronyms filtered)."""
         from daem0nmcp.emotion_detect import detect_emotion
@@ -2138,6 +2159,40 @@ class TestEmotionDetection:
         r = detect_emotion("My cat's name is Whiskers")
         assert r is None
 
+    def test_detect_explicit_label_is_lowercased(self):
+        """'I FEEL SO GRATEFUL' -> label normalized from the named group."""
+        from daem0nmcp.emotion_detect import detect_emotion
+        r = detect_emotion("honestly I FEEL SO GRATEFUL today")
+        assert r is not None
+        assert r["emotion_label"] == "grateful"
+        assert r["valence"] == "positive"
+        assert r["source"] == "explicit"
+
+    def test_detect_short_content(self):
+        """Shortest explicit statement still matches; short emphasis is not skipped."""
+        from daem0nmcp.emotion_detect import detect_emotion
+        r = detect_emotion("i'm sad")
+        assert r is not None
+        assert r["emotion_label"] == "sad"
+
+        r = detect_emotion("WOW!!")
+        assert r is not None
+        assert r["source"] == "emphasis"
+
+        assert detect_emotion("ok") is None
+
+    def test_detect_explicit_non_ascii_case_variant(self):
+        """'I am ſad' (long s) -> canonical label, no lookup error."""
+        from daem0nmcp.emotion_detect import detect_emotion
+        r = detect_emotion("I am \u017fad")
+        assert r is not None
+        assert r["emotion_label"] == "sad"
+        assert r["valence"] == "negative"
+
+        r = detect_emotion("I feel \u017ftressed")
+        assert r is not None
+        assert r["emotion_label"] == "stressed"
+
     # --- Enrichment integration tests (11-13) ---
 
     @pytest.mark.asyncio
@@ -2634,6 +2689,14 @@ class TestStyleDetection:
         result = analyze_style("I love this \u2764\ufe0f \u2b50")
         assert result["emoji_usage"] == 0.7
 
+    def test_count_emoji_ascii_and_symbols(self):
+        """Emoji counting matches the So/Sk categories for ASCII and non-ASCII text."""
+        from daem0nmcp.style_detect import _count_emoji
+
+        assert _count_emoji("plain ascii text") == 0
+        assert _count_emoji("a ^ b ` c") == 2
+        assert _count_emoji("caf\u00e9 \u00a9 \U0001F600 \u2b50") == 3
+
     def test_analyze_style_expressive(self):
         """Highly expressive text with caps and exclamation marks."""
         from daem0nmcp.style_detect import analyze_style
@@ -2758,6 +2821,40 @@ class TestStyleDetection:
         assert restored.expressiveness == round(original.expressiveness, 2)
         assert restored.message_count == original.message_count
 
+    @pytest.mark.asyncio
+    async def test_style_profile_persists_one_row_per_user(self, tmp_path):
+        """Style updates upsert a single flagged memory per user."""
+        from sqlalchemy import select
+        from daem0nmcp.database import DatabaseManager
+        from daem0nmcp.models import Memory
+        from daem0nmcp.style_detect import load_style_profile, update_user_style_profile
+
+        db = DatabaseManager(str(tmp_path))
+        await db.init_db()
+        ctx = MagicMock()
+        ctx.db_manager = db
+        try:
+            assert await load_style_profile(ctx, "Alice") is None
+
+            await update_user_style_profile(ctx, "Alice", {"formality": 1.0})
+            await update_user_style_profile(ctx, "Alice", {"formality": 1.0})
+            await update_user_style_profile(ctx, "Bob", {"formality": 0.0})
+
+            alice = await load_style_profile(ctx, "Alice")
+            bob = await load_style_profile(ctx, "Bob")
+            assert alice.message_count == 2
+            assert bob.message_count == 1
+            assert alice.formality > bob.formality
+
+            async with db.get_session() as session:
+                rows = (await session.execute(
+                    select(Memory.user_name, Memory.tags).where(Memory.is_style_profile == True)  # noqa: E712
+                )).all()
+            assert sorted(r.user_name for r in rows) == ["Alice", "Bob"]
+            assert all(r.tags == ["profile", "style"] for r in rows)
+        finally:
+            await db.close()
+
 
 class TestStyleBriefingIntegration:
     """Tests for style guidance in briefing and introspect (Phase 08-02)."""
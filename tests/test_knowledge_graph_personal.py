@@ -10,13 +10,17 @@ Covers:
 - Tool action validation
 """
 
+import re
+import sys
 import pytest
 import tempfile
 import shutil
 
+from sqlalchemy import select, text
+
 from daem0nmcp.database import DatabaseManager
 from daem0nmcp.entity_extractor import EntityExtractor
-from daem0nmcp.graph.knowledge_graph import KnowledgeGraph
+from daem0nmcp.graph.knowledge_graph import GraphDelta, KnowledgeGraph
 from daem0nmcp.graph.entity_resolver import EntityResolver
 from daem0nmcp.models import (
     ExtractedEntity,
@@ -24,6 +28,7 @@ from daem0nmcp.models import (
     EntityAlias,
     EntityRelationship,
     Memory,
+    MemoryRelationship,
 )
 
 
@@ -56,7 +61,7 @@ async def db(temp_storage):
 
 
 # ============================================================================
-# EntityExtractor Tests (3)
+# EntityExtractor Tests (7)
 # ============================================================================
 
 
@@ -94,9 +99,50 @@ class TestPersonalEntityExtraction:
 
         assert "my sister" in names
 
+    def test_pet_name_not_also_extracted_as_person(self, extractor):
+        """A pet name should only be extracted once, as the 'pet' type."""
+        text = "My dog Max loves the park"
+        entities = extractor.extract_entities(text)
+
+        assert [(e["type"], e["name"]) for e in entities] == [("pet", "Max")]
+
+    def test_person_pattern_is_case_sensitive(self, extractor):
+        """Person names need a leading capital followed by lowercase letters."""
+        from daem0nmcp.entity_extractor import PERSONAL_PATTERNS
+
+        assert not PERSONAL_PATTERNS["person"].flags & re.IGNORECASE
+        entities = extractor.extract_entities("hello HELLO there")
+        assert [e for e in entities if e["type"] == "person"] == []
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Ask Her Mom about Dr. Smith", ("relationship_ref", "Her Mom")),
+        ("Tell Her Dog Max hello", ("pet", "Max")),
+        ("Visited My Grandma Rose", ("relationship_ref", "My Grandma")),
+    ])
+    def test_capitalized_context_not_swallowed_by_person(self, extractor, text, expected):
+        """Capitalized pet/relationship phrases are still extracted next to person names."""
+        entities = extractor.extract_entities(text)
+
+        assert expected in {(e["type"], e["name"]) for e in entities}
+
+    def test_custom_patterns_are_applied(self):
+        """Custom patterns should be extracted alongside the personal ones."""
+        import re
+
+        extractor = EntityExtractor(
+            custom_patterns={"place": re.compile(r"\bin ([A-Z][a-z]+ville)\b")}
+        )
+        entities = extractor.extract_entities("Sarah lives in Springville")
+
+        pairs = {(e["type"], e["name"]) for e in entities}
+        assert ("person", "Sarah") in pairs
+        assert ("place", "Springville") in pairs
+        # Custom patterns must not leak into the shared defaults
+        assert "place" not in EntityExtractor().patterns
+
 
 # ============================================================================
-# EntityAlias and Resolution Tests (3)
+# EntityAlias and Resolution Tests (11)
 # ============================================================================
 
 
@@ -157,6 +203,165 @@ class TestEntityAliasModel:
         assert resolved_id == entity_id
         assert is_new is False
 
+    @pytest.mark.asyncio
+    async def test_resolver_warms_alias_cache(self, db):
+        """Aliases loaded at warmup resolve without touching the database."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+                mention_count=1,
+            )
+            session.add(sarah)
+            await session.flush()
+            session.add(EntityAlias(
+                entity_id=sarah.id, alias="My Sister",
+                alias_type="relationship", user_name="default",
+            ))
+            sarah_id = sarah.id
+
+        class NoQuerySession:
+            async def execute(self, *args, **kwargs):
+                raise AssertionError("resolve() should not query the database")
+
+        resolver = EntityResolver(db)
+        await resolver.ensure_cache_loaded("test")
+        resolved_id, is_new = await resolver.resolve(
+            name="my sister", entity_type="person", user_id="test",
+            session=NoQuerySession(),
+        )
+
+        assert (resolved_id, is_new) == (sarah_id, False)
+
+    @pytest.mark.asyncio
+    async def test_resolver_concurrent_warmup_loads_once(self, db):
+        """Concurrent ensure_cache_loaded calls for a cold project share one load."""
+        import asyncio
+
+        resolver = EntityResolver(db)
+        load_project = resolver._load_project
+        loads = []
+
+        async def counting_load(user_id):
+            loads.append(user_id)
+            await load_project(user_id)
+
+        resolver._load_project = counting_load
+        await asyncio.gather(*(resolver.ensure_cache_loaded("test") for _ in range(5)))
+
+        assert loads == ["test"]
+        assert resolver._load_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_resolver_alias_takes_precedence_over_name(self, db):
+        """An alias match wins over an entity whose name matches directly."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+                mention_count=1,
+            )
+            decoy = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sis", qualified_name="sis",
+                mention_count=1,
+            )
+            session.add_all([sarah, decoy])
+            await session.flush()
+            session.add(EntityAlias(
+                entity_id=sarah.id, alias="Sis",
+                alias_type="nickname", user_name="default",
+            ))
+            sarah_id = sarah.id
+
+        resolver = EntityResolver(db)
+        resolved_id, is_new = await resolver.resolve(
+            name="sis", entity_type="person", user_id="test",
+        )
+
+        assert resolved_id == sarah_id
+        assert is_new is False
+
+    @pytest.mark.asyncio
+    async def test_resolver_matches_qualified_name(self, db):
+        """An entity is found by qualified_name when its display name differs."""
+        async with db.get_session() as session:
+            entity = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Dr. Smith", qualified_name="smith",
+                mention_count=1,
+            )
+            session.add(entity)
+            await session.flush()
+            entity_id = entity.id
+
+        resolver = EntityResolver(db)
+        resolved_id, is_new = await resolver.resolve(
+            name="Smith", entity_type="person", user_id="test",
+        )
+        _, other_is_new = await resolver.resolve(
+            name="Smith", entity_type="place", user_id="test",
+        )
+
+        assert resolved_id == entity_id
+        assert is_new is False
+        assert other_is_new is True
+
+    @pytest.mark.asyncio
+    async def test_resolver_lookups_use_lower_indexes(self, db):
+        """Case-insensitive name/alias lookups hit the lower() expression indexes."""
+        async with db.get_session() as session:
+            name_plan = await session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM extracted_entities "
+                "WHERE user_id = 'test' AND entity_type = 'person' AND lower(name) = 'sarah'"
+            ))
+            alias_plan = await session.execute(text(
+                "EXPLAIN QUERY PLAN SELECT entity_id FROM entity_aliases "
+                "WHERE lower(alias) = 'sis' AND user_name = 'default'"
+            ))
+
+        assert "idx_extracted_entities_lower_name" in str(name_plan.all())
+        assert "idx_entity_aliases_lower_alias" in str(alias_plan.all())
+
+    @pytest.mark.parametrize("name, entity_type, expected", [
+        ("  Dr. Smith ", "person", "smith"),
+        ("My Sister", "relationship_ref", "sister"),
+        ("Max", "pet", "max"),
+        ("getUserName", "function", "get_user_name"),
+        (".\\src\\App.py", "file", "src/app.py"),
+        ("'Mindfulness'", "concept", "mindfulness"),
+        ("Something", "unknown_type", "something"),
+        ("", "person", ""),
+    ])
+    def test_resolver_normalize(self, name, entity_type, expected):
+        """normalize applies the type-specific rule, lowercasing unknown types."""
+        assert EntityResolver(None).normalize(name, entity_type) == expected
+
+    def test_resolver_clear_cache_is_scoped_to_project(self):
+        """clear_cache(user_id) leaves other projects' entries alone, even ones sharing a prefix."""
+        resolver = EntityResolver(None)
+        resolver._cache_put("a", ("person", "sarah"), 1)
+        resolver._cache_put("a:b", ("person", "sarah"), 2)
+
+        resolver.clear_cache("a")
+
+        assert resolver._cache_get("a", ("person", "sarah")) is None
+        assert resolver._cache_get("a:b", ("person", "sarah")) == 2
+
+    def test_resolver_cache_evicts_least_recently_used(self):
+        """Each project's cache is bounded and evicts its least recently used entry."""
+        resolver = EntityResolver(None, max_cache_size=2)
+        resolver._cache_put("a", ("person", "sarah"), 1)
+        resolver._cache_put("a", ("person", "john"), 2)
+        resolver._cache_get("a", ("person", "sarah"))  # john is now least recent
+        resolver._cache_put("a", ("pet", "max"), 3)
+        resolver._cache_put("b", ("person", "john"), 4)
+
+        assert resolver._cache_get("a", ("person", "john")) is None
+        assert resolver._cache_get("a", ("person", "sarah")) == 1
+        assert resolver._cache_get("a", ("pet", "max")) == 3
+        assert resolver._cache_get("b", ("person", "john")) == 4
+
     def test_entity_relationship_model(self):
         """EntityRelationship can be created linking two entities."""
         rel = EntityRelationship(
@@ -183,6 +388,234 @@ class TestEntityAliasModel:
 class TestKnowledgeGraphPersonal:
     """Test KnowledgeGraph entity-entity loading and relational queries."""
 
+    @pytest.mark.asyncio
+    async def test_graph_node_indexes(self, db):
+        """Entity-by-type and memory node lists match the graph, also after reload."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+            )
+            max_pet = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="pet", name="Max", qualified_name="max",
+            )
+            mem = Memory(content="Sarah walked Max", categories=["relationship"], user_name="default")
+            session.add_all([sarah, max_pet, mem])
+            await session.flush()
+            session.add_all([
+                MemoryEntityRef(memory_id=mem.id, entity_id=sarah.id),
+                MemoryEntityRef(
+                    memory_id=mem.id, entity_id=max_pet.id, context_snippet="...walked Max...",
+                ),
+            ])
+            sarah_id, max_id, mem_id = sarah.id, max_pet.id, mem.id
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+        await kg.reload_from_db()
+        kg._loaded = False  # as MemoryManager.invalidate_graph_cache() does
+        await kg.ensure_loaded()
+
+        assert kg.get_entity_nodes("pet") == [f"entity:{max_id}"]
+        assert kg.get_entity_nodes("place") == []
+        assert sorted(kg.get_entity_nodes()) == sorted([f"entity:{sarah_id}", f"entity:{max_id}"])
+        assert kg.get_memory_nodes() == [f"memory:{mem_id}"]
+        assert sorted(kg.get_entities_for_memory(mem_id)) == sorted([sarah_id, max_id])
+        assert kg.get_memories_for_entity(max_id) == [mem_id]
+        # Label strings from each row are interned into shared objects
+        assert kg._graph.nodes[f"entity:{max_id}"]["entity_type"] is sys.intern("pet")
+        # Snippets stay in SQLite; reference edges only carry their labels
+        assert kg.get_edge_attributes(f"memory:{mem_id}", f"entity:{max_id}") == {
+            "edge_type": "references", "relationship": "mentions",
+        }
+
+    @pytest.mark.asyncio
+    async def test_apply_delta_matches_reload(self, db):
+        """apply_delta leaves the graph and its indexes as a fresh load would."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+            )
+            max_pet = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="pet", name="Max", qualified_name="max",
+            )
+            mem = Memory(content="Sarah walked Max", categories=["relationship"], user_name="default")
+            session.add_all([sarah, max_pet, mem])
+            await session.flush()
+            session.add_all([
+                MemoryEntityRef(memory_id=mem.id, entity_id=sarah.id),
+                MemoryEntityRef(memory_id=mem.id, entity_id=max_pet.id),
+                EntityAlias(entity_id=max_pet.id, alias="the dog", alias_type="nickname", user_name="default"),
+            ])
+            sarah_id, max_id, mem_id = sarah.id, max_pet.id, mem.id
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        async with db.get_session() as session:
+            bella = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="pet", name="Bella", qualified_name="bella",
+            )
+            mem2 = Memory(content="Sarah adopted Bella", categories=["event"], user_name="default")
+            session.add_all([bella, mem2])
+            await session.flush()
+            session.add_all([
+                MemoryEntityRef(memory_id=mem2.id, entity_id=sarah_id),
+                MemoryEntityRef(memory_id=mem2.id, entity_id=bella.id),
+                MemoryRelationship(source_id=mem_id, target_id=mem2.id, relationship="led_to"),
+                EntityRelationship(
+                    source_entity_id=sarah_id, target_entity_id=bella.id,
+                    relationship="owns", user_name="default",
+                ),
+            ])
+            await session.execute(
+                text("DELETE FROM entity_aliases WHERE entity_id = :id"), {"id": max_id}
+            )
+            await session.execute(
+                text("DELETE FROM memory_entity_refs WHERE entity_id = :id"), {"id": max_id}
+            )
+            await session.execute(
+                text("DELETE FROM extracted_entities WHERE id = :id"), {"id": max_id}
+            )
+            bella_id, mem2_id = bella.id, mem2.id
+
+        kg.apply_delta(GraphDelta(
+            added_entities=[{
+                "id": bella_id, "entity_type": "pet", "name": "Bella",
+                "qualified_name": "bella", "user_id": "test",
+                "mention_count": 1, "user_name": "default",
+            }],
+            removed_entity_ids=[max_id],
+            added_refs=[
+                {"memory_id": mem2_id, "entity_id": sarah_id, "relationship": "mentions"},
+                {"memory_id": mem2_id, "entity_id": bella_id, "relationship": "mentions"},
+            ],
+            added_memory_relationships=[
+                {"source_id": mem_id, "target_id": mem2_id, "relationship": "led_to"},
+            ],
+            added_entity_relationships=[
+                {"source_entity_id": sarah_id, "target_entity_id": bella_id, "relationship": "owns"},
+            ],
+        ))
+
+        fresh = KnowledgeGraph(db)
+        await fresh.ensure_loaded()
+
+        assert dict(kg._graph.nodes(data=True)) == dict(fresh._graph.nodes(data=True))
+        assert sorted(kg._graph.edges()) == sorted(fresh._graph.edges())
+        assert kg.get_entity_nodes("pet") == [f"entity:{bella_id}"]
+        assert kg.get_memory_nodes() == fresh.get_memory_nodes()
+        assert kg._alias_index == fresh._alias_index == {}
+        assert kg._name_index == fresh._name_index
+        assert kg._type_lower == fresh._type_lower
+
+        # Re-adding an existing entity updates it in place and keeps its edges
+        kg.apply_delta(GraphDelta(added_entities=[{
+            "id": sarah_id, "entity_type": "person", "name": "Sarah",
+            "qualified_name": "sarah", "user_id": "test",
+            "mention_count": 5, "user_name": "default",
+        }]))
+        assert kg.get_node_attributes(f"entity:{sarah_id}")["mention_count"] == 5
+        assert sorted(kg.get_memories_for_entity(sarah_id)) == sorted([mem_id, mem2_id])
+        assert kg.get_entity_nodes("person") == [f"entity:{sarah_id}"]
+
+    @pytest.mark.asyncio
+    async def test_apply_delta_removal_keeps_keys_owned_by_other_entities(self, db):
+        """Removing an entity only drops the name and alias keys that resolve to it."""
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        def entity(entity_id, entity_type):
+            return {
+                "id": entity_id, "entity_type": entity_type, "name": "Max",
+                "qualified_name": "max", "user_id": "test",
+                "mention_count": 1, "user_name": "default",
+            }
+
+        kg.apply_delta(GraphDelta(
+            added_entities=[entity(1, "pet"), entity(2, "person")],
+            added_aliases=[
+                {"alias": "the dog", "user_name": "default", "entity_id": 1},
+                {"alias": "the dog", "user_name": "default", "entity_id": 2},
+                {"alias": "buddy", "user_name": "default", "entity_id": 2},
+            ],
+        ))
+        assert kg._name_index == {("max", "default"): 1}
+
+        kg.apply_delta(GraphDelta(removed_entity_ids=[2]))
+        assert kg._name_index == {("max", "default"): 1}
+        assert kg._alias_index == {("the dog", "default"): 1}
+
+        kg.apply_delta(GraphDelta(removed_entity_ids=[1]))
+        assert kg._name_index == kg._alias_index == {}
+        assert kg._name_keys == kg._alias_keys == {}
+
+    @pytest.mark.asyncio
+    async def test_get_related_memories_respects_depth(self, db):
+        """BFS follows outgoing memory edges up to max_depth, in discovery order."""
+        async with db.get_session() as session:
+            mems = [
+                Memory(content=f"memory {i}", categories=["event"], user_name="default")
+                for i in range(4)
+            ]
+            session.add_all(mems)
+            await session.flush()
+            a, b, c, d = (m.id for m in mems)
+            session.add_all([
+                MemoryRelationship(source_id=a, target_id=b, relationship="led_to"),
+                MemoryRelationship(source_id=b, target_id=c, relationship="led_to"),
+                MemoryRelationship(source_id=d, target_id=a, relationship="led_to"),
+                MemoryRelationship(source_id=c, target_id=a, relationship="led_to"),
+            ])
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        assert kg.get_related_memories(a, max_depth=1) == [b]
+        assert kg.get_related_memories(a, max_depth=3) == [b, c]
+        assert kg.get_related_memories(d, max_depth=3) == [a, b, c]
+        assert kg.get_related_memories(999999) == []
+
+    @pytest.mark.asyncio
+    async def test_entity_neighborhood_single_bfs(self, db):
+        """Related memories come from all direct memories, without duplicates or seeds."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+            )
+            mems = [
+                Memory(content=f"memory {i}", categories=["event"], user_name="default")
+                for i in range(5)
+            ]
+            session.add_all([sarah, *mems])
+            await session.flush()
+            a, b, c, d, e = (m.id for m in mems)
+            session.add_all([
+                MemoryEntityRef(memory_id=a, entity_id=sarah.id),
+                MemoryEntityRef(memory_id=b, entity_id=sarah.id),
+                # Both direct memories lead to c; b also links back to a
+                MemoryRelationship(source_id=a, target_id=c, relationship="led_to"),
+                MemoryRelationship(source_id=b, target_id=c, relationship="led_to"),
+                MemoryRelationship(source_id=b, target_id=a, relationship="led_to"),
+                MemoryRelationship(source_id=c, target_id=d, relationship="led_to"),
+                MemoryRelationship(source_id=d, target_id=e, relationship="led_to"),
+            ])
+            sarah_id = sarah.id
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        hood = kg.get_entity_neighborhood(sarah_id, max_hops=3)
+        assert sorted(hood["direct_memories"]) == sorted([a, b])
+        assert hood["related_memories"] == [c, d]
+        assert kg.get_entity_neighborhood(sarah_id, max_hops=1)["related_memories"] == []
+        assert kg.get_entity_neighborhood(999999)["related_memories"] == []
+
     @pytest.mark.asyncio
     async def test_graph_loads_entity_relationships(self, db):
         """Graph should create edges between entity nodes from EntityRelationship rows."""
@@ -266,6 +699,34 @@ class TestKnowledgeGraphPersonal:
         assert len(result["memories"]) == 1
         assert "Sarah called me yesterday" in result["memories"][0]["content"]
 
+    @pytest.mark.asyncio
+    async def test_query_relational_fetches_memories_in_chunks(self, db, monkeypatch):
+        """Memory ids are fetched across several IN chunks without losing rows."""
+        from daem0nmcp.graph import knowledge_graph
+
+        monkeypatch.setattr(knowledge_graph, "_MEMORY_FETCH_CHUNK_SIZE", 2)
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+            )
+            mems = [
+                Memory(content=f"Sarah note {i}", categories=["relationship"], user_name="default")
+                for i in range(5)
+            ]
+            session.add_all([sarah, *mems])
+            await session.flush()
+            session.add_all([MemoryEntityRef(memory_id=m.id, entity_id=sarah.id) for m in mems])
+            mem_ids = {m.id for m in mems}
+
+        kg = KnowledgeGraph(db)
+        result = await kg.query_relational(["Sarah"], user_name="default")
+
+        assert {m["id"] for m in result["memories"]} == mem_ids
+        first = next(m for m in result["memories"] if m["content"] == "Sarah note 0")
+        assert first["categories"] == ["relationship"]
+        assert first["created_at"] is not None
+
     @pytest.mark.asyncio
     async def test_query_relational_multi_hop(self, db):
         """query_relational should traverse alias -> person entity -> pet entity."""
@@ -371,6 +832,237 @@ class TestKnowledgeGraphPersonal:
         assert result["found"] is False
         assert "No query parts provided" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_resolve_reference_uses_indexes_and_falls_back(self, db):
+        """References known at load resolve from memory; later aliases fall back to the DB."""
+        async with db.get_session() as session:
+            sarah = ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+            )
+            session.add(sarah)
+            await session.flush()
+            session.add(EntityAlias(
+                entity_id=sarah.id, alias="my sister",
+                alias_type="relationship", user_name="default",
+            ))
+            sarah_id = sarah.id
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        async with db.get_session() as session:
+            session.add(EntityAlias(
+                entity_id=sarah_id, alias="sis",
+                alias_type="nickname", user_name="default",
+            ))
+
+        assert kg._alias_index[("my sister", "default")] == sarah_id
+        assert await kg._resolve_reference("My Sister", "default") == sarah_id
+        assert await kg._resolve_reference("SARAH", "default") == sarah_id
+        assert await kg._resolve_reference("Sarah", "someone_else") is None
+        assert await kg._resolve_reference("sis", "default") == sarah_id
+
+
+# ============================================================================
+# EntityManager Tests (7)
+# ============================================================================
+
+
+async def _create_memory(db, content):
+    async with db.get_session() as session:
+        mem = Memory(content=content, categories=["relationship"], user_name="default")
+        session.add(mem)
+        await session.flush()
+        return mem.id
+
+
+class TestProcessMemory:
+    """Test entity, reference and alias creation from memory content."""
+
+    @pytest.mark.asyncio
+    async def test_process_memory_creates_refs_and_alias(self, db):
+        """Entities get one ref each and the relationship_ref becomes an alias."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        content = "My sister Sarah walked my dog Max with John"
+        memory_id = await _create_memory(db, content)
+
+        result = await manager.process_memory(memory_id, content, user_id="test")
+
+        assert result["refs_created"] == 3  # Sarah, Max, John
+        assert result["aliases_created"] == 1
+
+        async with db.get_session() as session:
+            refs = (await session.execute(
+                select(MemoryEntityRef).where(MemoryEntityRef.memory_id == memory_id)
+            )).scalars().all()
+            aliases = (await session.execute(select(EntityAlias))).scalars().all()
+
+        assert len(refs) == 3
+        assert [a.alias for a in aliases] == ["my sister"]
+
+    @pytest.mark.asyncio
+    async def test_process_memory_links_all_relationship_refs_to_first_person(self, db):
+        """Every relationship_ref becomes an alias of the first person mentioned."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        content = "My sister Sarah and my mom met John"
+        memory_id = await _create_memory(db, content)
+
+        result = await manager.process_memory(memory_id, content, user_id="test")
+
+        assert result["aliases_created"] == 2
+        async with db.get_session() as session:
+            rows = (await session.execute(
+                select(EntityAlias.alias, ExtractedEntity.name)
+                .join(ExtractedEntity, ExtractedEntity.id == EntityAlias.entity_id)
+            )).all()
+        assert sorted(rows) == [("my mom", "Sarah"), ("my sister", "Sarah")]
+
+    @pytest.mark.asyncio
+    async def test_process_memory_is_idempotent_for_refs(self, db):
+        """Reprocessing a memory creates no duplicate refs or aliases."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        content = "My sister Sarah walked my dog Max with John"
+        memory_id = await _create_memory(db, content)
+
+        await manager.process_memory(memory_id, content, user_id="test")
+        result = await manager.process_memory(memory_id, content, user_id="test")
+
+        assert result["refs_created"] == 0
+        assert result["aliases_created"] == 0
+
+        async with db.get_session() as session:
+            sarah = (await session.execute(
+                select(ExtractedEntity).where(ExtractedEntity.name == "Sarah")
+            )).scalar_one()
+        assert sarah.mention_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_memory_delta_keeps_loaded_graph_in_sync(self, db):
+        """Applying each extraction's graph_delta matches a fresh load."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        first = "My sister Sarah walked my dog Max with John"
+        first_id = await _create_memory(db, first)
+        await manager.process_memory(first_id, first, user_id="test")
+
+        kg = KnowledgeGraph(db)
+        await kg.ensure_loaded()
+
+        # Reuses Sarah and John (mention bumps) and adds a new entity and alias
+        second = "My mom met Sarah and John and Sarah at the park with Bella"
+        second_id = await _create_memory(db, second)
+        result = await manager.process_memory(second_id, second, user_id="test")
+        kg.apply_delta(result["graph_delta"])
+
+        fresh = KnowledgeGraph(db)
+        await fresh.ensure_loaded()
+
+        assert dict(kg._graph.nodes(data=True)) == dict(fresh._graph.nodes(data=True))
+        assert sorted(kg._graph.edges(data=True)) == sorted(fresh._graph.edges(data=True))
+        assert kg._alias_index == fresh._alias_index
+        assert kg._name_index == fresh._name_index
+        assert kg.get_memory_nodes() == fresh.get_memory_nodes()
+
+    @pytest.mark.asyncio
+    async def test_process_memories_batch_shares_entities(self, db):
+        """Batch processing resolves repeated names to one entity across memories."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        contents = ["My sister Sarah called", "Went hiking with Sarah and John", "it rained all day"]
+        memory_ids = [await _create_memory(db, c) for c in contents]
+
+        results = await manager.process_memories_batch(
+            [{"memory_id": m, "content": c} for m, c in zip(memory_ids, contents)],
+            user_id="test",
+        )
+
+        assert [r["memory_id"] for r in results] == memory_ids
+        assert [r["refs_created"] for r in results] == [1, 2, 0]
+        assert results[0]["aliases_created"] == 1
+        async with db.get_session() as session:
+            sarah = (await session.execute(
+                select(ExtractedEntity).where(ExtractedEntity.name == "Sarah")
+            )).scalar_one()
+        assert sarah.mention_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_memory_entity_ref_is_rejected(self, db):
+        """The unique (memory_id, entity_id) index backs process_memory's ON CONFLICT."""
+        from sqlalchemy.exc import IntegrityError
+
+        memory_id = await _create_memory(db, "Sarah called")
+        with pytest.raises(IntegrityError):
+            async with db.get_session() as session:
+                sarah = ExtractedEntity(
+                    user_id="test", user_name="default",
+                    entity_type="person", name="Sarah", qualified_name="sarah",
+                )
+                session.add(sarah)
+                await session.flush()
+                session.add_all([
+                    MemoryEntityRef(memory_id=memory_id, entity_id=sarah.id),
+                    MemoryEntityRef(memory_id=memory_id, entity_id=sarah.id),
+                ])
+                await session.flush()
+
+    @pytest.mark.asyncio
+    async def test_get_memories_for_entity_merges_matching_entities(self, db):
+        """Memories are gathered across same-named entities without duplicates."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        manager = EntityManager(db)
+        first = "Max called and asked about my dog Max"
+        second = "Went hiking with Max"
+        first_id = await _create_memory(db, first)
+        second_id = await _create_memory(db, second)
+        await manager.process_memory(first_id, first, user_id="test")
+        await manager.process_memory(second_id, second, user_id="test")
+
+        result = await manager.get_memories_for_entity("Max", user_id="test")
+
+        assert result["found"] is True
+        assert sorted(result["entity_types"]) == ["person", "pet"]
+        assert sorted(m["id"] for m in result["memories"]) == [first_id, second_id]
+
+        pets_only = await manager.get_memories_for_entity(
+            "Max", user_id="test", entity_type="pet"
+        )
+        assert pets_only["entity_types"] == ["pet"]
+        assert [m["id"] for m in pets_only["memories"]] == [first_id]
+        assert pets_only["memories"][0]["content"] == first
+        assert pets_only["memories"][0]["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_memories_for_entity_without_memories(self, db):
+        """An entity with no references is found but has no memories."""
+        from daem0nmcp.entity_manager import EntityManager
+
+        async with db.get_session() as session:
+            session.add(ExtractedEntity(
+                user_id="test", user_name="default",
+                entity_type="person", name="Sarah", qualified_name="sarah",
+                mention_count=3,
+            ))
+
+        manager = EntityManager(db)
+        found = await manager.get_memories_for_entity("Sarah", user_id="test")
+        missing = await manager.get_memories_for_entity("Nobody", user_id="test")
+
+        assert found == {
+            "entity_name": "Sarah", "found": True,
+            "entity_types": ["person"], "mention_count": 3, "memories": [],
+        }
+        assert missing["found"] is False
+
 
 # ============================================================================
 # Tool Integration Test (1)
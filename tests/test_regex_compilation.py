@@ -17,3 +17,9 @@ class TestPrecompiledRegex:
         assert isinstance(PATTERNS, dict)
         for name, pattern in PATTERNS.items():
             assert isinstance(pattern, re.Pattern), f"{name} should be compiled"
+
+    def test_entity_stop_words_are_frozen(self):
+        """Entity stop words should be an immutable set for O(1) lookups."""
+        from daem0nmcp.entity_extractor import STOP_WORDS
+        assert isinstance(STOP_WORDS, frozenset)
+        assert all(word == word.lower() for word in STOP_WORDS)
@@ -7,6 +7,7 @@ from daem0nmcp.similarity import (
     extract_code_symbols,
     TFIDFIndex,
     calculate_memory_decay,
+    calculate_memory_decay_batch,
     detect_conflict
 )
 
@@ -237,6 +238,57 @@ class TestMemoryDecay:
         # Verify the multiplier is 0.7
         assert AUTO_DECAY_MULTIPLIER == 0.7
 
+    def test_decay_constant_matches_half_life(self):
+        """A precomputed decay constant should give the same weight as its half-life."""
+        from daem0nmcp.auto_detect import CATEGORY_DECAY_K, CATEGORY_DECAY_K_AUTO
+        twenty_days_ago = datetime.now(timezone.utc) - timedelta(days=20)
+        weight_half_life = calculate_memory_decay(twenty_days_ago, half_life_days=30.0)
+        weight_k = calculate_memory_decay(
+            twenty_days_ago, decay_constant=CATEGORY_DECAY_K['emotion']
+        )
+        assert abs(weight_half_life - weight_k) < 1e-6
+
+        weight_auto_half_life = calculate_memory_decay(twenty_days_ago, half_life_days=30.0 * 0.7)
+        weight_auto_k = calculate_memory_decay(
+            twenty_days_ago, decay_constant=CATEGORY_DECAY_K_AUTO['emotion']
+        )
+        assert abs(weight_auto_half_life - weight_auto_k) < 1e-6
+
+    def test_decay_constant_overrides_half_life(self):
+        """decay_constant takes precedence over half_life_days when both are given."""
+        import math
+        ten_days_ago = datetime.now(timezone.utc) - timedelta(days=10)
+        weight = calculate_memory_decay(
+            ten_days_ago, half_life_days=1000.0, decay_constant=math.log(2) / 10.0
+        )
+        assert abs(weight - 0.5) < 1e-3
+
+    def test_batch_matches_scalar(self):
+        """Vectorized decay should agree with calculate_memory_decay per memory."""
+        import math
+        now = datetime.now(timezone.utc)
+        created = [
+            now - timedelta(days=5),
+            now - timedelta(days=200),
+            (now - timedelta(days=45)).replace(tzinfo=None),
+            now + timedelta(days=1),
+        ]
+        ks = [math.log(2) / 30.0, math.log(2) / 14.0, math.log(2) / 90.0, math.log(2) / 30.0]
+        batch = calculate_memory_decay_batch(created, ks)
+        for created_at, k, weight in zip(created, ks, batch):
+            expected = calculate_memory_decay(created_at, decay_constant=k)
+            assert abs(expected - weight) < 1e-6
+
+    def test_batch_zero_constant_never_decays(self):
+        """A zero decay constant (permanent memory) keeps full weight, no floor."""
+        old = datetime.now(timezone.utc) - timedelta(days=3650)
+        weights = calculate_memory_decay_batch([old], [0.0])
+        assert weights[0] == 1.0
+
+    def test_batch_empty(self):
+        """No memories yields an empty weight array."""
+        assert len(calculate_memory_decay_batch([], [])) == 0
+
 
 class TestConflictDetection:
     """Test memory conflict detection."""